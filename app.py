@@ -1,13 +1,104 @@
 import streamlit as st
+import queue
 import re
+import threading
+import time
 from pathlib import Path
 from db_scraper.scraper import DiscografiaScraper
 from db_scraper import config
 
+_PLAYLIST_ID_RE = re.compile(r"/playlists/(\d+)/")
+
+# Seconds between reruns that refresh the progress of a running download
+_POLL_INTERVAL = 0.5
+
+
+@st.cache_resource
+def get_default_output_dir() -> Path:
+    """Returns the default download folder, computed once instead of on every Streamlit rerun."""
+    return Path.home() / "Downloads" / "db_downloads"
+
+
+@st.cache_resource
+def get_scraper(output_dir: str, use_cache: bool) -> DiscografiaScraper:
+    """Returns a scraper shared across reruns, so its HTTP session and connection pool are reused."""
+    return DiscografiaScraper(output_dir=output_dir, use_cache=use_cache)
+
+
+@st.cache_data(ttl=3600)
+def parse_playlist_url(url: str) -> str | None:
+    """Extracts the playlist ID from a playlist URL, or returns None if the URL is not in the expected format."""
+    match = _PLAYLIST_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def run_scraper(
+    scraper: DiscografiaScraper,
+    search_type: str,
+    input_id: str,
+    save_report: bool,
+    save_as_xlsx: bool,
+    max_workers: int,
+    events: queue.Queue,
+    cancel_event: threading.Event,
+) -> None:
+    """Runs the download workflow in a background thread, reporting progress and the outcome through `events`."""
+
+    def progress_cb(n_done: int, n_total: int) -> None:
+        events.put(("progress", (n_done, n_total)))
+
+    try:
+        if search_type == "Playlist":
+            scraper.download_from_playlist(
+                playlist_id=input_id,
+                save_report=save_report,
+                report_xlsx=save_as_xlsx,
+                report_columns=config.UI_REPORT_COLUMNS,
+                progress_cb=progress_cb,
+                max_workers=max_workers,
+                cancel_event=cancel_event,
+            )
+        else:
+            scraper.download_from_author(
+                author_name=input_id,
+                save_report=save_report,
+                report_xlsx=save_as_xlsx,
+                report_columns=config.UI_REPORT_COLUMNS,
+                progress_cb=progress_cb,
+                max_workers=max_workers,
+                cancel_event=cancel_event,
+            )
+        events.put(("done", None))
+    except Exception as e:
+        events.put(("error", e))
+
+
+def poll_run(run: dict) -> bool:
+    """Applies the events reported so far to `run` and returns whether its worker thread is still running."""
+    # Checked before draining, so an outcome reported right before the thread exits is never missed
+    alive = run["worker"].is_alive()
+    while True:
+        try:
+            event, payload = run["events"].get_nowait()
+        except queue.Empty:
+            break
+        if event == "progress":
+            run["progress"] = payload
+        else:
+            run["outcome"] = (event, payload)
+    if not alive and run["outcome"] is None:
+        run["outcome"] = ("error", RuntimeError("O processo foi interrompido."))
+    return alive
+
 
 st.set_page_config(page_title="DB Downloader", page_icon="🎵", layout="centered")
 st.title("🎵 DB Downloader")
 
+# The current run lives in the session state, so a rerun (e.g. any widget interaction) reattaches to its worker
+# thread instead of orphaning it, and the inputs stay locked while it is alive
+run = st.session_state.get("run")
+running = run is not None and poll_run(run)
+
 
 # 1. Download type selection
 st.header("1. Escolha o tipo de busca")
@@ -15,6 +106,7 @@ search_type = st.radio(
     "Você quer baixar músicas de uma Playlist ou de um Autor?",
     ("Playlist", "Autor"),
     label_visibility="collapsed",
+    disabled=running,
 )
 
 # 2. Data input
@@ -23,17 +115,19 @@ if search_type == "Playlist":
     input_url = st.text_input(
         "URL da Playlist:",
         placeholder="Ex: https://discografiabrasileira.com.br/playlists/247664/samba-do-sindicatis",
+        disabled=running,
     )
     input_id = None
 
 else:
-    input_id = st.text_input("Nome do Autor:", placeholder="Ex: Nilton Bastos")
+    input_id = st.text_input(
+        "Nome do Autor:", placeholder="Ex: Nilton Bastos", disabled=running
+    )
 
 # 3. Output directory definition
 st.header("3. Local de salvamento")
 try:
-    default_download_folder = Path.home() / "Downloads"
-    final_output_dir = default_download_folder / "db_downloads"
+    final_output_dir = get_default_output_dir()
     st.info(f"Os downloads serão salvos em: `{final_output_dir}`")
     st.markdown(
         "📂 Dentro desta pasta, as músicas serão organizadas em subpastas com o nome do primeiro autor de cada faixa."
@@ -51,22 +145,39 @@ save_report = st.checkbox(
     "Salvar relatório com os resultados",
     value=True,
     help="Se marcado, um arquivo com os metadados será salvo.",
+    disabled=running,
 )
 
 report_format_option = st.selectbox(
-    "Formato do relatório:", ("XLSX (Excel)", "CSV"), disabled=not save_report
+    "Formato do relatório:",
+    ("XLSX (Excel)", "CSV"),
+    disabled=not save_report or running,
+)
+
+use_cache = st.checkbox(
+    "Reutilizar metadados de execuções anteriores",
+    value=True,
+    help="Se desmarcado, as URLs dos áudios serão consultadas novamente no site, ignorando o cache local.",
+    disabled=running,
+)
+
+max_workers = st.slider(
+    "Downloads simultâneos:",
+    min_value=1,
+    max_value=config.HTTP_POOL_SIZE,
+    value=config.AUDIO_DOWNLOAD_MAX_WORKERS,
+    help="Número de músicas baixadas ao mesmo tempo. Reduza se a sua conexão for lenta ou instável.",
+    disabled=running,
 )
 
-if st.button("Baixar Músicas"):
+if st.button("Baixar Músicas", disabled=running):
     if search_type == "Playlist":
         if not input_url:
             st.warning("Por favor, insira a URL da Playlist.")
             st.stop()
         else:
-            match = re.search(r"/playlists/(\d+)/", input_url)
-            if match:
-                input_id = match.group(1)
-            else:
+            input_id = parse_playlist_url(input_url)
+            if not input_id:
                 st.error(
                     "URL da playlist inválida. Não foi possível encontrar o ID. Verifique o formato da URL."
                 )
@@ -77,43 +188,83 @@ if st.button("Baixar Músicas"):
             st.stop()
 
     if input_id:
-        scraper = DiscografiaScraper(output_dir=str(final_output_dir))
+        scraper = get_scraper(str(final_output_dir), use_cache)
 
         save_as_xlsx = "XLSX" in report_format_option
 
-        st.info("Iniciando o processo... Por favor, aguarde.")
-
-        with st.spinner(
-            "Extraindo metadados e baixando áudios... Este processo pode demorar."
-        ):
-            try:
-                if search_type == "Playlist":
-                    scraper.download_from_playlist(
-                        playlist_id=input_id,
-                        save_report=save_report,
-                        report_xlsx=save_as_xlsx,
-                        report_columns=config.UI_REPORT_COLUMNS,
-                    )
-                else:
-                    scraper.download_from_author(
-                        author_name=input_id,
-                        save_report=save_report,
-                        report_xlsx=save_as_xlsx,
-                        report_columns=config.UI_REPORT_COLUMNS,
-                    )
-
-                st.success("Processo concluído com sucesso!")
-                st.write(
-                    f"Verifique a pasta `{final_output_dir}` para encontrar os arquivos de áudio."
-                )
+        # The scraper runs in a background thread; the script only renders the events it reports
+        events = queue.Queue()
+        cancel_event = threading.Event()
+        worker = threading.Thread(
+            target=run_scraper,
+            args=(
+                scraper,
+                search_type,
+                input_id,
+                save_report,
+                save_as_xlsx,
+                max_workers,
+                events,
+                cancel_event,
+            ),
+            daemon=True,
+        )
+        worker.start()
+        st.session_state["run"] = {
+            "worker": worker,
+            "events": events,
+            "cancel_event": cancel_event,
+            "output_dir": final_output_dir,
+            "save_report": save_report,
+            "save_as_xlsx": save_as_xlsx,
+            "progress": None,
+            "outcome": None,
+            "celebrated": False,
+        }
+        # Rerun right away so the inputs are rendered locked
+        st.rerun()
+
+if run is not None and running:
+    st.info("Processo em andamento... Por favor, aguarde.")
+    if run["progress"] is None:
+        st.write("Extraindo metadados... Este processo pode demorar.")
+    else:
+        n_done, n_total = run["progress"]
+        st.progress(n_done / n_total if n_total else 1.0)
+        st.write(f"Baixando áudios: {n_done} de {n_total}")
 
-                if save_report:
-                    report_type = "XLSX" if save_as_xlsx else "CSV"
-                    st.write(
-                        f"Um relatório em formato {report_type} também foi salvo na mesma pasta."
-                    )
+    if run["cancel_event"].is_set():
+        st.warning("Cancelando... Os downloads em andamento serão concluídos.")
+    elif st.button("Cancelar"):
+        run["cancel_event"].set()
+        st.rerun()
 
-                st.balloons()
+    time.sleep(_POLL_INTERVAL)
+    st.rerun()
 
-            except Exception as e:
-                st.error(f"Ocorreu um erro inesperado durante o processo: {e}")
+elif run is not None:
+    event, payload = run["outcome"]
+    if event == "done":
+        n_done, n_total = run["progress"] or (0, 0)
+        if run["cancel_event"].is_set():
+            st.warning(
+                f"Processo cancelado. {n_done} de {n_total} músicas foram processadas antes do cancelamento."
+            )
+        else:
+            st.success("Processo concluído com sucesso!")
+        st.write(
+            f"Verifique a pasta `{run['output_dir']}` para encontrar os arquivos de áudio."
+        )
+
+        if run["save_report"]:
+            report_type = "XLSX" if run["save_as_xlsx"] else "CSV"
+            st.write(
+                f"Um relatório em formato {report_type} também foi salvo na mesma pasta, com as músicas baixadas."
+            )
+
+        # Shown once, not again on every later rerun
+        if not run["celebrated"] and not run["cancel_event"].is_set():
+            run["celebrated"] = True
+            st.balloons()
+    else:
+        st.error(f"Ocorreu um erro inesperado durante o processo: {payload}")
@@ -0,0 +1,184 @@
+"""
+Persistent SQLite caches that let repeated runs skip work already done: the audio URLs returned by the
+content API and the files already uploaded to Google Drive.
+"""
+
+import sqlite3
+import time
+import logging
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_SQLITE_MAX_VARIABLES = 500
+
+
+class AudioUrlCache:
+    """
+    A small SQLite-backed cache mapping track data-ids to their audio URLs.
+
+    The audio URL of a track rarely changes, so re-running the scraper on the same playlist or author does not need
+    to query the content API again for tracks already resolved in a previous run. Entries older than `expire_after`
+    seconds are ignored and fetched again.
+
+    Attributes:
+        db_path (Path): The path to the SQLite database file.
+        expire_after (int): The lifetime of an entry, in seconds.
+
+    Notes:
+        - A new connection is opened for each operation, so the same instance can be used from any thread.
+        - Only successfully resolved URLs should be stored; failures are retried on the next run.
+        - The database (and its parent directory) is recreated when missing, so deleting the cache file or the
+          outputs directory of a long-lived scraper only empties the cache.
+    """
+
+    def __init__(self, db_path: Path, expire_after: int):
+        """
+        Initializes the cache and creates the database table if it does not exist.
+
+        Args:
+            db_path (Path): The path to the SQLite database file. Its parent directory is created if it does not exist.
+            expire_after (int): The lifetime of an entry, in seconds.
+        """
+        self.db_path = Path(db_path)
+        self.expire_after = expire_after
+        self._connect().close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # The table is ensured on every connection, since the file may have been deleted since the last one
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS audio_urls ("
+                "data_id TEXT PRIMARY KEY, audio_url TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+        return conn
+
+    def get_many(self, data_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Looks up the audio URLs of several tracks at once.
+
+        Args:
+            data_ids (Iterable[str]): The data-ids to look up.
+
+        Returns:
+            Dict[str, str]: The cached audio URLs for the data-ids found and not expired.
+        """
+        ids = list(data_ids)
+        min_fetched_at = time.time() - self.expire_after
+        found = {}
+        with closing(self._connect()) as conn:
+            for start in range(0, len(ids), _SQLITE_MAX_VARIABLES):
+                batch = ids[start : start + _SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT data_id, audio_url FROM audio_urls "
+                    f"WHERE fetched_at >= ? AND data_id IN ({placeholders})",
+                    [min_fetched_at, *batch],
+                )
+                found.update(rows)
+        return found
+
+    def set_many(self, audio_urls: Dict[str, str]) -> None:
+        """
+        Stores or refreshes the audio URLs of several tracks in a single transaction.
+
+        Args:
+            audio_urls (Dict[str, str]): A mapping from data-id to audio URL.
+        """
+        if not audio_urls:
+            return
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO audio_urls (data_id, audio_url, fetched_at) VALUES (?, ?, ?)",
+                [(data_id, url, now) for data_id, url in audio_urls.items()],
+            )
+        logger.debug(f"{len(audio_urls)} URLs de áudio gravadas no cache.")
+
+
+class UploadStateCache:
+    """
+    A SQLite-backed record of the local files already uploaded to Google Drive.
+
+    Each entry is keyed by the author folder and file name, and stores the size and modification time the local file
+    had when it was uploaded, together with its Drive URL. A later run can then reuse the URL of any file that has not
+    changed, without querying Google Drive at all.
+
+    Attributes:
+        db_path (Path): The path to the SQLite database file.
+
+    Notes:
+        - The parent directory of the database is created if it does not exist.
+        - A new connection is opened for each operation, so the same instance can be used from any thread.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initializes the record and creates the database table if it does not exist.
+
+        Args:
+            db_path (Path): The path to the SQLite database file.
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS uploads ("
+                "pasta TEXT NOT NULL, nome TEXT NOT NULL, size INTEGER NOT NULL, "
+                "mtime REAL NOT NULL, url TEXT NOT NULL, PRIMARY KEY (pasta, nome))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def get_many(
+        self, keys: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Tuple[int, float, str]]:
+        """
+        Looks up the recorded uploads of several files at once.
+
+        Args:
+            keys (Iterable[Tuple[str, str]]): The (pasta, nome_arquivo) pairs to look up.
+
+        Returns:
+            Dict[Tuple[str, str], Tuple[int, float, str]]: The recorded (size, mtime, url) of the files found.
+        """
+        keys = list(keys)
+        # Each key takes two parameters
+        batch_size = _SQLITE_MAX_VARIABLES // 2
+        found = {}
+        with closing(self._connect()) as conn:
+            for start in range(0, len(keys), batch_size):
+                batch = keys[start : start + batch_size]
+                placeholders = ",".join(["(?, ?)"] * len(batch))
+                rows = conn.execute(
+                    f"SELECT pasta, nome, size, mtime, url FROM uploads "
+                    f"WHERE (pasta, nome) IN (VALUES {placeholders})",
+                    [value for key in batch for value in key],
+                )
+                found.update(
+                    ((pasta, nome), (size, mtime, url))
+                    for pasta, nome, size, mtime, url in rows
+                )
+        return found
+
+    def set_many(self, records: Dict[Tuple[str, str], Tuple[int, float, str]]) -> None:
+        """
+        Stores or refreshes the uploads of several files in a single transaction.
+
+        Args:
+            records (Dict[Tuple[str, str], Tuple[int, float, str]]): A mapping from (pasta, nome_arquivo)
+                to the (size, mtime, url) of the uploaded file.
+        """
+        if not records:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO uploads (pasta, nome, size, mtime, url) VALUES (?, ?, ?, ?, ?)",
+                [(pasta, nome, *record) for (pasta, nome), record in records.items()],
+            )
@@ -14,6 +14,32 @@ API_TRACKLIST_URL_TEMPLATE = "https://discografiabrasileira.com.br/fonograma/@re
 API_CONTENT_URL_TEMPLATE = "https://discografiabrasileira.com.br/api/1.0/content/{data_id}?fields=_id,name,audio[contentUrl;duration],creator[_id;name],recordingOf[_id;name;author[_id;name]]"
 API_AUTHOR_URL_TEMPLATE = "https://discografiabrasileira.com.br/fonograma/xAuthor/{author_name}/@property/audio/"
 
+# Concurrency settings
+CONTENT_API_MAX_WORKERS = 16
+GDRIVE_UPLOAD_MAX_WORKERS = 8
+AUDIO_DOWNLOAD_MAX_WORKERS = 8
+AUDIO_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # bytes per streamed read when saving MP3 files
+REPORT_READ_MAX_WORKERS = 4  # report files read at once when merging
+
+# Google Drive settings
+GDRIVE_LIST_PAGE_SIZE = 1000
+UPLOAD_STATE_BATCH_SIZE = 50  # uploads recorded per SQLite transaction
+
+# Content API cache settings
+CONTENT_CACHE_EXPIRE_AFTER = 7 * 24 * 60 * 60  # seconds
+
+# HTTP session settings
+HTTP_POOL_SIZE = 32
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.3
+HTTP_RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+HTTP_TIMEOUT = (5, 10)  # (connect, read) seconds
+HTTP_DOWNLOAD_TIMEOUT = (5, 20)  # (connect, read) seconds, for MP3 downloads
+HTTP_LISTING_TIMEOUT = (5, 60)  # (connect, read) seconds, for server-rendered track listings
+
+# Number of rows formatted per block when writing CSV reports
+CSV_WRITE_CHUNK_SIZE = 10_000
+
 # Output columns for the final dataset
 COLUMN_DTYPES = {
     'data_id': str,
@@ -1,16 +1,24 @@
 import pandas as pd
+import pyarrow as pa
 from pathlib import Path
 import logging
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 from pydrive2.auth import GoogleAuth
 from pydrive2.drive import GoogleDrive
 from datetime import datetime
 
 from . import paths
 from . import config
+from .cache import UploadStateCache
+from .tools import read_report, write_report
 
 logger = logging.getLogger(__name__)
 _gdrive_instance = None
+_gdrive_lock = threading.Lock()
+# Folder IDs already resolved in this process, keyed by (parent_folder_id, folder_name)
+_FOLDER_CACHE: Dict[Tuple[str, str], str] = {}
 
 
 def get_gdrive_instance() -> Optional[GoogleDrive]:
@@ -35,34 +43,36 @@ def get_gdrive_instance() -> Optional[GoogleDrive]:
 
     Notes:
         - Uses the global _gdrive_instance variable to cache the authenticated client.
+        - The creation is guarded by a lock, so concurrent callers never authenticate twice.
         - Relies on the paths.CLIENT_SECRETS_FILE and paths.TOKEN_FILE for configuration and credential storage.
         - Logs progress, warnings, and errors using the logger.
         - Intended to be used as the only entry point for Google Drive access in the application.
     """
     global _gdrive_instance
-    if _gdrive_instance:
-        return _gdrive_instance
-    try:
-        gauth = GoogleAuth()
-        gauth.settings["client_config_file"] = str(paths.CLIENT_SECRETS_FILE)
-        gauth.LoadCredentialsFile(str(paths.TOKEN_FILE))
-        if gauth.credentials is None:
-            logger.info(
-                "Nenhuma credencial encontrada, iniciando autenticação via navegador..."
-            )
-            gauth.LocalWebserverAuth()
-        elif gauth.access_token_expired:
-            logger.info("Credenciais expiraram, atualizando...")
-            gauth.Refresh()
-        else:
-            gauth.Authorize()
-        gauth.SaveCredentialsFile(str(paths.TOKEN_FILE))
-        _gdrive_instance = GoogleDrive(gauth)
-        logger.info("Autenticação com o Google Drive bem-sucedida.")
-        return _gdrive_instance
-    except Exception as e:
-        logger.error(f"Falha na autenticação com o Google Drive: {e}")
-        return None
+    with _gdrive_lock:
+        if _gdrive_instance:
+            return _gdrive_instance
+        try:
+            gauth = GoogleAuth()
+            gauth.settings["client_config_file"] = str(paths.CLIENT_SECRETS_FILE)
+            gauth.LoadCredentialsFile(str(paths.TOKEN_FILE))
+            if gauth.credentials is None:
+                logger.info(
+                    "Nenhuma credencial encontrada, iniciando autenticação via navegador..."
+                )
+                gauth.LocalWebserverAuth()
+            elif gauth.access_token_expired:
+                logger.info("Credenciais expiraram, atualizando...")
+                gauth.Refresh()
+            else:
+                gauth.Authorize()
+            gauth.SaveCredentialsFile(str(paths.TOKEN_FILE))
+            _gdrive_instance = GoogleDrive(gauth)
+            logger.info("Autenticação com o Google Drive bem-sucedida.")
+            return _gdrive_instance
+        except Exception as e:
+            logger.error(f"Falha na autenticação com o Google Drive: {e}")
+            return None
 
 
 def find_or_create_folder(
@@ -73,6 +83,7 @@ def find_or_create_folder(
 
     This function searches for a folder with the specified name under the given parent folder ID in Google Drive.
     If the folder exists, it returns its ID. If not, it creates the folder and returns the new folder's ID.
+    Resolved IDs are cached for the lifetime of the process, so each folder is queried at most once.
 
     Args:
         drive (GoogleDrive): An authenticated GoogleDrive instance from PyDrive2.
@@ -83,22 +94,28 @@ def find_or_create_folder(
         str: The ID of the found or newly created folder.
 
     Workflow:
-        1. Escapes the folder name for use in the query.
-        2. Searches for a folder with the given name and parent ID in Google Drive.
-        3. If found, returns the folder's ID.
-        4. If not found, creates the folder under the parent and returns the new folder's ID.
+        1. Returns the cached ID if the folder was already resolved under the same parent.
+        2. Escapes the folder name for use in the query.
+        3. Searches for a folder with the given name and parent ID in Google Drive.
+        4. If found, caches and returns the folder's ID.
+        5. If not found, creates the folder under the parent, caches and returns the new folder's ID.
 
     Notes:
         - Uses the Google Drive API via PyDrive2 to search and create folders.
         - Logs folder creation events using the logger.
         - The search is case-sensitive and matches the exact folder name.
         - Intended for organizing uploads into structured directories in Google Drive.
+        - The cache is not invalidated if a folder is deleted in Google Drive while the application is running.
     """
+    cache_key = (parent_folder_id, folder_name)
+    if cache_key in _FOLDER_CACHE:
+        return _FOLDER_CACHE[cache_key]
+
     folder_name_escaped = folder_name.replace("'", "\\'")
     query = f"title = '{folder_name_escaped}' and mimeType = 'application/vnd.google-apps.folder' and '{parent_folder_id}' in parents and trashed = false"
     folder_list = drive.ListFile({"q": query}).GetList()
     if folder_list:
-        return folder_list[0]["id"]
+        folder_id = folder_list[0]["id"]
     else:
         logger.info(f"Criando pasta '{folder_name}' no Google Drive...")
         folder_metadata = {
@@ -108,38 +125,135 @@ def find_or_create_folder(
         }
         folder = drive.CreateFile(folder_metadata)
         folder.Upload()
-        return folder["id"]
+        folder_id = folder["id"]
+
+    _FOLDER_CACHE[cache_key] = folder_id
+    return folder_id
+
+
+def _cache_subfolders(drive: GoogleDrive, parent_folder_id: str) -> None:
+    """
+    Resolves all the subfolders of a Google Drive folder in a single query and adds them to the folder cache.
+
+    Args:
+        drive (GoogleDrive): An authenticated GoogleDrive instance from PyDrive2.
+        parent_folder_id (str): The ID of the folder whose subfolders should be cached.
+
+    Notes:
+        - After this call, `find_or_create_folder` only queries Google Drive for subfolders that do not exist yet.
+        - Entries already in the cache are kept, so a folder resolved earlier always keeps the same ID.
+    """
+    query = f"'{parent_folder_id}' in parents and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
+    folder_list = drive.ListFile(
+        {"q": query, "maxResults": config.GDRIVE_LIST_PAGE_SIZE}
+    ).GetList()
+    for folder in folder_list:
+        _FOLDER_CACHE.setdefault((parent_folder_id, folder["title"]), folder["id"])
+
+
+def _list_folder_files(drive: GoogleDrive, folder_id: str) -> Dict[str, str]:
+    """
+    Lists the files of a Google Drive folder in a single query.
+
+    Args:
+        drive (GoogleDrive): An authenticated GoogleDrive instance from PyDrive2.
+        folder_id (str): The ID of the folder to list.
+
+    Returns:
+        Dict[str, str]: A mapping from file title to its Drive URL ('alternateLink').
+
+    Notes:
+        - PyDrive2 follows the result pages automatically; requesting `config.GDRIVE_LIST_PAGE_SIZE` items per page
+          (the API default is 100) keeps large author folders to one or a few round trips.
+    """
+    query = f"'{folder_id}' in parents and trashed = false"
+    file_list = drive.ListFile(
+        {"q": query, "maxResults": config.GDRIVE_LIST_PAGE_SIZE}
+    ).GetList()
+    return {gfile["title"]: gfile["alternateLink"] for gfile in file_list}
+
+
+def _upload_one(
+    drive: GoogleDrive,
+    position: int,
+    local_file_path: Path,
+    nome_arquivo: str,
+    author_drive_folder_id: str,
+) -> Tuple[int, Optional[str]]:
+    """
+    Uploads a single local MP3 file to an author folder in Google Drive.
 
+    Args:
+        drive (GoogleDrive): An authenticated GoogleDrive instance from PyDrive2.
+        position (int): The position of the track in the audit DataFrame, returned unchanged to match the result.
+        local_file_path (Path): The path to the local MP3 file.
+        nome_arquivo (str): The name of the file in Google Drive.
+        author_drive_folder_id (str): The ID of the author folder in Google Drive.
+
+    Returns:
+        Tuple[int, Optional[str]]: The given position and the Drive URL of the file, or None if the upload failed.
 
-def upload_audios_from_csv(csv_path: str, local_music_dir: str) -> None:
+    Notes:
+        - Runs in worker threads; PyDrive2 keeps one HTTP object per thread, so the same drive instance can be shared.
     """
-    Reads a CSV audit file, uploads local MP3 files to Google Drive, and saves an updated audit CSV with Drive URLs.
+    logger.info(f"Processando '{nome_arquivo}'...")
+    try:
+        gfile = drive.CreateFile(
+            {"title": nome_arquivo, "parents": [{"id": author_drive_folder_id}]}
+        )
+        gfile.SetContentFile(str(local_file_path))
+        gfile.Upload()
+
+        gdrive_url = gfile["alternateLink"]
+        logger.info(f"-> Upload de '{nome_arquivo}' concluído. URL: {gdrive_url}")
+        return position, gdrive_url
+    except Exception as e:
+        logger.error(f"Erro ao fazer o upload de '{nome_arquivo}': {e}")
+        return position, None
+
+
+def upload_audios_from_csv(
+    csv_path: str, local_music_dir: str, save_as_csv: bool = False
+) -> None:
+    """
+    Reads an audit file, uploads local MP3 files to Google Drive, and saves an updated audit file with Drive URLs.
 
     This function authenticates with Google Drive, iterates through the provided CSV file containing track metadata,
     uploads each corresponding MP3 file from the specified local directory to Google Drive (organizing by author),
-    and updates the CSV with the resulting Google Drive URLs. If a file already exists in Drive, its URL is reused.
-    The updated audit CSV is saved with a timestamp in the filename.
+    and updates the audit with the resulting Google Drive URLs. If a file already exists in Drive, its URL is reused.
+    The updated audit is saved as Parquet (or CSV, if requested) with a timestamp in the filename.
 
     Args:
-        csv_path (str): Path to the audit CSV file containing track metadata and local file references.
+        csv_path (str): Path to the audit file (CSV, Parquet or Feather) containing track metadata and local file references.
         local_music_dir (str): Path to the base directory where local MP3 files are stored (organized by author subfolders).
+        save_as_csv (bool, optional): If True, saves the updated audit as CSV instead of Parquet. Defaults to False.
 
     Returns:
         None
 
     Workflow:
         1. Authenticates with Google Drive using the singleton instance.
-        2. Reads the audit CSV and ensures a 'gdrive_url' column exists.
-        3. For each row, checks for the local MP3 file and uploads it to the appropriate Drive folder (by author).
-        4. If the file already exists in Drive, retrieves and records its URL.
-        5. Updates the DataFrame with the Drive URL for each uploaded or found file.
-        6. Saves a new audit CSV with the updated URLs and a timestamp in the filename.
+        2. Reads the audit file (format detected from its extension) and ensures a 'gdrive_url' column exists.
+        3. For each row, checks for the local MP3 file and reuses the URL recorded by a previous run if the file
+           has the same size and modification time.
+        4. For the other files, resolves the appropriate Drive folder (by author), serially, and reuses the URL of
+           files that already exist in it. The existing author folders are resolved with one listing of the main
+           folder, and each author folder is listed once.
+        5. Uploads the remaining files concurrently with `_upload_one`, once per Drive folder and file name, recording
+           each upload in the upload state.
+        6. Collects the Drive URL for each uploaded or found file, for every row that references it, and assigns them to
+           the DataFrame in a single column write.
+        7. Saves a new audit file with the updated URLs and a timestamp in the filename.
 
     Notes:
-        - If authentication fails or the CSV cannot be read, the function logs an error and returns early.
+        - If authentication fails or the audit file cannot be read, the function logs an error and returns early.
         - Local files are expected to be organized in subfolders by author under the provided music directory.
+        - The number of concurrent uploads is limited by `config.GDRIVE_UPLOAD_MAX_WORKERS`.
+        - The upload state is kept in `paths.UPLOAD_STATE_FILE`, so repeated runs only touch Google Drive for new or
+          changed files.
         - The function logs progress, warnings, and errors using the logger.
-        - The output audit CSV is saved in the same directory as the input, with '_upload_audit_<timestamp>' appended to the filename.
+        - The output audit is saved in the same directory as the input, with '_upload_audit_<timestamp>' appended to the filename
+          and a '.parquet' extension ('.csv' if `save_as_csv` is True).
     """
     logger.info("--- Iniciando processo de upload para o Google Drive ---")
     drive = get_gdrive_instance()
@@ -148,64 +262,124 @@ def upload_audios_from_csv(csv_path: str, local_music_dir: str) -> None:
         return
 
     try:
-        df = pd.read_csv(csv_path, dtype=config.COLUMN_DTYPES)
+        df = read_report(csv_path)
         if "gdrive_url" not in df.columns:
             df["gdrive_url"] = ""
     except FileNotFoundError:
-        logger.error(f"Arquivo CSV não encontrado: {csv_path}")
+        logger.error(f"Arquivo de auditoria não encontrado: {csv_path}")
         return
 
-    main_drive_folder_id = find_or_create_folder(drive, "db_downloads")
-
-    for index, row in df.iterrows():
-        pasta_autor = str(row.get("pasta", ""))
-        nome_arquivo = str(row.get("nome_arquivo", ""))
+    # Plain arrays and a list of results avoid per-row Series creation and .loc writes
+    empty_column = pd.Series("", index=df.index)
+    pastas = df.get("pasta", empty_column).fillna("").astype(str).to_numpy()
+    nomes_arquivos = (
+        df.get("nome_arquivo", empty_column).fillna("").astype(str).to_numpy()
+    )
+    gdrive_urls = df["gdrive_url"].tolist()
 
+    local_files = {}
+    for position, (pasta_autor, nome_arquivo) in enumerate(zip(pastas, nomes_arquivos)):
         if not pasta_autor or not nome_arquivo:
             continue
 
         local_file_path = Path(local_music_dir) / pasta_autor / nome_arquivo
+        try:
+            stat = local_file_path.stat()
+        except FileNotFoundError:
+            logger.warning(f"Arquivo local não encontrado: {local_file_path}. Pulando.")
+            continue
+        local_files[position] = (
+            pasta_autor,
+            nome_arquivo,
+            local_file_path,
+            stat.st_size,
+            stat.st_mtime,
+        )
+
+    upload_state = UploadStateCache(paths.UPLOAD_STATE_FILE)
+    recorded_uploads = upload_state.get_many(
+        (pasta_autor, nome_arquivo)
+        for pasta_autor, nome_arquivo, *_ in local_files.values()
+    )
 
-        if local_file_path.exists():
-            logger.info(f"Processando '{nome_arquivo}'...")
-            author_drive_folder_id = find_or_create_folder(
-                drive, pasta_autor, parent_folder_id=main_drive_folder_id
-            )
-
-            query = f"title = '{nome_arquivo}' and '{author_drive_folder_id}' in parents and trashed = false"
-            existing_files = drive.ListFile({"q": query}).GetList()
+    # Author folders are resolved serially so that concurrent uploads never race to create the same folder.
+    # Each folder is listed once, instead of one existence query per file.
+    main_drive_folder_id = None
+    files_by_folder = {}
+    # Keyed by Drive folder and file name, so a file referenced by several rows (repeated tracks) is uploaded once
+    upload_tasks = {}
+    task_positions = {}
+    new_records = {}
+    for position, (
+        pasta_autor,
+        nome_arquivo,
+        local_file_path,
+        size,
+        mtime,
+    ) in local_files.items():
+        recorded = recorded_uploads.get((pasta_autor, nome_arquivo))
+        if recorded and recorded[:2] == (size, mtime):
+            logger.info(f"Arquivo '{nome_arquivo}' já enviado anteriormente. Pulando.")
+            gdrive_urls[position] = recorded[2]
+            continue
 
-            if existing_files:
-                gdrive_url = existing_files[0]["alternateLink"]
-                logger.info(
-                    f"Arquivo '{nome_arquivo}' já existe no Google Drive. URL recuperada."
-                )
-                df.loc[index, "gdrive_url"] = gdrive_url
-                continue
+        if main_drive_folder_id is None:
+            main_drive_folder_id = find_or_create_folder(drive, "db_downloads")
+            # One listing resolves every existing author folder, instead of one query per author
+            _cache_subfolders(drive, main_drive_folder_id)
+        author_drive_folder_id = find_or_create_folder(
+            drive, pasta_autor, parent_folder_id=main_drive_folder_id
+        )
+        if author_drive_folder_id not in files_by_folder:
+            files_by_folder[author_drive_folder_id] = _list_folder_files(
+                drive, author_drive_folder_id
+            )
 
-            try:
-                gfile = drive.CreateFile(
-                    {"title": nome_arquivo, "parents": [{"id": author_drive_folder_id}]}
-                )
-                gfile.SetContentFile(str(local_file_path))
-                gfile.Upload()
+        existing_url = files_by_folder[author_drive_folder_id].get(nome_arquivo)
+        if existing_url:
+            logger.info(
+                f"Arquivo '{nome_arquivo}' já existe no Google Drive. URL recuperada."
+            )
+            gdrive_urls[position] = existing_url
+            new_records[(pasta_autor, nome_arquivo)] = (size, mtime, existing_url)
+            continue
 
-                gdrive_url = gfile["alternateLink"]
-                df.loc[index, "gdrive_url"] = gdrive_url
-                logger.info(
-                    f"-> Upload de '{nome_arquivo}' concluído. URL: {gdrive_url}"
-                )
-            except Exception as e:
-                logger.error(f"Erro ao fazer o upload de '{nome_arquivo}': {e}")
-        else:
-            logger.warning(f"Arquivo local não encontrado: {local_file_path}. Pulando.")
+        task_key = (author_drive_folder_id, nome_arquivo)
+        task_positions.setdefault(task_key, []).append(position)
+        upload_tasks.setdefault(
+            task_key, (position, local_file_path, nome_arquivo, author_drive_folder_id)
+        )
+    upload_state.set_many(new_records)
+
+    if upload_tasks:
+        new_records = {}
+        max_workers = min(config.GDRIVE_UPLOAD_MAX_WORKERS, len(upload_tasks))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda task: _upload_one(drive, *task), upload_tasks.values()
+            )
+            for task_key, (position, gdrive_url) in zip(upload_tasks, results):
+                if not gdrive_url:
+                    continue
+                for row_position in task_positions[task_key]:
+                    gdrive_urls[row_position] = gdrive_url
+                pasta_autor, nome_arquivo, _, size, mtime = local_files[position]
+                new_records[(pasta_autor, nome_arquivo)] = (size, mtime, gdrive_url)
+                # Recording in batches keeps the progress if the process is interrupted, without one commit per file
+                if len(new_records) >= config.UPLOAD_STATE_BATCH_SIZE:
+                    upload_state.set_many(new_records)
+                    new_records = {}
+        upload_state.set_many(new_records)
+
+    df["gdrive_url"] = pd.array(gdrive_urls, dtype=pd.ArrowDtype(pa.string()))
 
     p = Path(csv_path)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_filename = f"{p.stem}_upload_audit_{timestamp}.csv"
+    output_suffix = ".csv" if save_as_csv else ".parquet"
+    output_filename = f"{p.stem}_upload_audit_{timestamp}{output_suffix}"
     output_filepath = p.parent / output_filename
 
-    df.to_csv(output_filepath, index=False, encoding="utf-8-sig")
+    write_report(df, output_filepath)
     logger.info(
         f"--- Processo de upload concluído! Relatório atualizado salvo em: {output_filepath} ---"
     )
@@ -12,6 +12,8 @@ OUTPUTS_DIR = PROJECT_ROOT / "outputs"
 
 # --- Specific Output Paths ---
 MUSICS_DIR = OUTPUTS_DIR / "musics"
+UPLOAD_STATE_FILE = OUTPUTS_DIR / "upload_state.sqlite"
+CONTENT_CACHE_FILE = OUTPUTS_DIR / "content_cache.sqlite"
 
 # --- Credential & Token Paths ---
 CLIENT_SECRETS_FILE = PROJECT_ROOT / "client_secrets.json"
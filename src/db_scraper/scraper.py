@@ -1,19 +1,76 @@
 import requests
-from bs4 import BeautifulSoup, Tag
-from typing import List, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+import soupsieve as sv
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import os
+import shutil
+import uuid
 import pandas as pd
 import re
-import unicodedata
 from datetime import datetime
 from pathlib import Path
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from urllib.parse import quote_plus
 
 from . import config
+from . import paths
+from .cache import AudioUrlCache
+from .tools import read_report, write_report
 
 logger = logging.getLogger(__name__)
 
+# Called as progress_cb(n_done, n_total) while the audio files are downloaded
+ProgressCallback = Callable[[int, int], None]
+
+# CSS selector for the pagination link, compiled once at import time
+_SEL_NEXT_PAGE = sv.compile('span.pagination-item a[aria-label="Next"]')
+
+# Characters removed from folder and report names; str.translate deletes them without a regex
+_INVALID_PATH_CHARS = str.maketrans("", "", '\\/*?:"<>|')
+# Report names additionally have their spaces replaced by underscores, in the same pass
+_REPORT_NAME_CHARS = str.maketrans(" ", "_", '\\/*?:"<>|')
+
+# Regular expressions used to build file names, compiled once at import time
+_RE_NON_SLUG_CHARS = re.compile(r"[^a-z0-9\s-]")
+_RE_SLUG_SEPARATORS = re.compile(r"[\s-]+")
+
+# The content API URL is built for every track; splitting the template once avoids str.format on each call
+_CONTENT_URL_PREFIX, _CONTENT_URL_SUFFIX = config.API_CONTENT_URL_TEMPLATE.split(
+    "{data_id}"
+)
+
+# Restrict parsing to the track elements and their contents (plus the pagination links, for paginated listings).
+# They must stay in sync with the "track" and "pagination-item" classes used by the site.
+_TRACKS_ONLY = SoupStrainer("div", class_="track")
+_TRACKS_AND_PAGINATION = SoupStrainer(
+    ["div", "span"], class_=["track", "pagination-item"]
+)
+
+
+def _select_report_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Returns `df` with exactly `columns`, in order.
+
+    A frame that already matches is returned as is, and a subset of existing columns is taken with a plain column
+    selection; only columns missing from `df` need a reindex, which adds them empty.
+    """
+    columns = list(columns)
+    if list(df.columns) == columns:
+        return df
+    if df.columns.is_unique and set(columns).issubset(df.columns):
+        return df[columns]
+    return df.reindex(columns=columns)
+
+
+def _safe_report_name(name: str) -> str:
+    """Turns an author or report name into a lowercase report filename fragment, without invalid path characters."""
+    return name.translate(_REPORT_NAME_CHARS).lower()
+
 
 class DiscografiaScraper:
     """
@@ -37,47 +94,111 @@ class DiscografiaScraper:
         - Logging is used to track progress, warnings, and errors throughout the scraping and download process.
     """
 
-    def __init__(self, output_dir: str):
+    def __init__(
+        self,
+        output_dir: str,
+        use_cache: bool = True,
+        session: Optional[requests.Session] = None,
+    ):
         """
         Initializes the DiscografiaScraper with a specified output directory and prepares the HTTP session.
 
         This constructor sets up the base directory for saving all CSV and MP3 files, configures a persistent
-        requests.Session with default HTTP headers, ensures the output directory exists, and logs the initialization status.
+        requests.Session with default HTTP headers and a pooled, retrying HTTPAdapter, ensures the output directory exists,
+        and logs the initialization status.
 
         Args:
             output_dir (str): The base directory where all output files (CSV and MP3) will be saved.
+            use_cache (bool, optional): If True, audio URLs resolved from the content API are cached on disk and reused
+                in later runs. Defaults to True.
+            session (requests.Session, optional): An existing session to use for all requests (e.g. one shared with
+                other code, or a test double). It is used as given and is not closed by `close`. Defaults to None,
+                which creates the pooled session described below.
 
         Attributes:
             output_dir (Path): The resolved output directory as a Path object.
             session (requests.Session): The persistent HTTP session used for all requests, with headers set from config.
             config (module): The configuration module with constants and templates.
+            audio_url_cache (AudioUrlCache or None): The on-disk audio URL cache, or None if caching is disabled.
 
         Workflow:
             1. Sets the output directory and creates it if it does not exist.
-            2. Initializes a requests.Session and updates its headers with the default headers from config.
-            3. Logs the initialization and output path.
+            2. Initializes a requests.Session (unless one is given) and updates its headers with the default headers
+               from config.
+            3. Mounts an HTTPAdapter sized for the concurrent requests, with retries on transient errors.
+            4. Opens the audio URL cache (`paths.CONTENT_CACHE_FILE`), unless disabled.
+            5. Logs the initialization and output path.
 
         Notes:
             - All HTTP requests throughout the scraper use the same session for efficiency and consistent headers.
+            - The connection pool keeps up to `config.HTTP_POOL_SIZE` keep-alive connections per host, so the worker
+              threads reuse connections instead of opening a new TCP/TLS connection per request.
+            - Requests use separate connect and read timeouts, so an unreachable host fails fast and a stalled request
+              can never hang the run. Content API calls use `config.HTTP_TIMEOUT`; the server-rendered track listings,
+              which can take much longer to start responding, use the longer read timeout of
+              `config.HTTP_LISTING_TIMEOUT`.
             - If the output directory does not exist, it will be created automatically.
+            - The audio URL cache is kept under `paths.OUTPUTS_DIR`, like the upload state, so the output directory
+              (which is audited and uploaded) only holds the downloads and reports.
             - A log message is generated to confirm the initialization and output path.
         """
         self.config = config
         self.output_dir = Path(output_dir)
-        self.session = requests.Session()
-        self.session.headers.update(self.config.BASE_HEADERS)
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.config.BASE_HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=self.config.HTTP_POOL_SIZE,
+                pool_maxsize=self.config.HTTP_POOL_SIZE,
+                max_retries=Retry(
+                    total=self.config.HTTP_MAX_RETRIES,
+                    backoff_factor=self.config.HTTP_BACKOFF_FACTOR,
+                    status_forcelist=self.config.HTTP_RETRY_STATUS_CODES,
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
         os.makedirs(self.output_dir, exist_ok=True)
+        self.audio_url_cache = (
+            AudioUrlCache(
+                paths.CONTENT_CACHE_FILE,
+                expire_after=self.config.CONTENT_CACHE_EXPIRE_AFTER,
+            )
+            if use_cache
+            else None
+        )
         logger.info(
             f"Scraper inicializado. Os arquivos serão salvos em: {self.output_dir}"
         )
 
+    def close(self) -> None:
+        """
+        Closes the HTTP session created by the scraper, releasing the pooled keep-alive connections.
+
+        Notes:
+            - The scraper can also be used as a context manager (`with DiscografiaScraper(...) as scraper:`), which
+              calls this method on exit.
+            - Long-lived instances (e.g. the one shared by the Streamlit app) keep the session open on purpose, so
+              later runs reuse the same connections.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "DiscografiaScraper":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _parse_track_data(self, track: Tag) -> Dict[str, Any]:
         """
         Extracts metadata from a single BeautifulSoup 'track' element.
 
         This method parses the HTML structure of a track element to extract its unique ID, title, author(s), performer(s), album, year,
-        recording and release dates, and attempts to retrieve the audio URL from the content API if a data-id is present. It is intended
-        to be used as a helper for scraping track information from playlist or author pages.
+        recording and release dates. It does not perform any HTTP request: the audio URL is left empty and filled afterwards by
+        `_fill_audio_urls`. It is intended to be used as a helper for scraping track information from playlist or author pages.
 
         Args:
             track (Tag): A BeautifulSoup Tag object representing a single track element from the Discografia Brasileira website.
@@ -92,46 +213,74 @@ class DiscografiaScraper:
                 - ano_lancamento_disco (str): The release year of the album, or empty string if missing.
                 - data_gravacao (str): The recording date, or empty string if missing.
                 - data_lancamento (str): The release date, or empty string if missing.
-                - audio_url (str): The URL to the audio file, or empty string if not available.
+                - audio_url (str): Always an empty string; see `_fill_audio_urls`.
 
         Notes:
-            - If the track does not have a data-id, the audio_url will be an empty string.
             - If any field is missing in the HTML, a default value is used (e.g., empty string or "Título Desconhecido").
-            - Warnings are logged if the audio URL cannot be retrieved from the content API.
+            - The track subtree is walked once. Single-valued fields are read from the first element with their class (or the
+              first property label with their text); authors and performers are collected from every matching container.
         """
-        data_id_tag = track.select_one(".play-bttn")
+        # A single walk over the track subtree indexes the elements of each class, in document order, and the first
+        # property label with each text, instead of one subtree search per field
+        elements = {}
+        labels = {}
+        for tag in track.find_all(class_=True):
+            for css_class in tag["class"]:
+                elements.setdefault(css_class, []).append(tag)
+            if "property-label" in tag["class"] and tag.name == "div":
+                labels.setdefault(tag.get_text(strip=True), tag)
+
+        def first_element(css_class: str) -> Optional[Tag]:
+            matches = elements.get(css_class)
+            return matches[0] if matches else None
+
+        def first_link(css_class: str) -> Optional[Tag]:
+            container = first_element(css_class)
+            return container.find("a") if container else None
+
+        def all_links_text(css_class: str) -> str:
+            links = [
+                link
+                for container in elements.get(css_class, [])
+                for link in container.find_all("a")
+            ]
+            return " / ".join([tag.text.strip() for tag in links])
+
+        data_id_tag = first_element("play-bttn")
         data_id = data_id_tag.get("data-id") if data_id_tag else None
 
-        titulo_tag = track.select_one(".track-name a")
+        titulo_tag = first_link("track-name")
         titulo = (
             titulo_tag.text.strip().title() if titulo_tag else "Título Desconhecido"
         )
 
-        author_tags = track.select(".track-author a")
-        autor = " / ".join([tag.text.strip() for tag in author_tags])
+        autor = all_links_text("track-author")
+        interprete = all_links_text("track-performer")
 
-        interprete_tags = track.select(".track-performer a")
-        interprete = " / ".join([tag.text.strip() for tag in interprete_tags])
-
-        genero_tag = track.select_one(".tags a.tag-name")
+        genero_tag = next(
+            (
+                tag
+                for container in elements.get("tags", [])
+                for tag in container.find_all("a", class_="tag-name", limit=1)
+            ),
+            None,
+        )
         genero = genero_tag.text.strip() if genero_tag else ""
 
-        disco_tag = track.select_one(".track-duration a")
+        disco_tag = first_link("track-duration")
         disco = disco_tag.text.strip() if disco_tag else ""
 
-        ano_disco_tag = track.select_one(".track-year")
+        ano_disco_tag = first_element("track-year")
         ano_disco = ano_disco_tag.text.strip() if ano_disco_tag else ""
 
-        gravacao_label = track.find("div", class_="property-label", string="gravacao")
+        gravacao_label = labels.get("gravacao")
         data_gravacao = (
             gravacao_label.find_next_sibling("div").text.strip()
             if gravacao_label
             else ""
         )
 
-        lancamento_label = track.find(
-            "div", class_="property-label", string="lancamento"
-        )
+        lancamento_label = labels.get("lancamento")
         data_lancamento = (
             lancamento_label.find_next_sibling("div").text.strip()
             if lancamento_label
@@ -140,19 +289,6 @@ class DiscografiaScraper:
 
         fonte_url = titulo_tag.get("href", "") if titulo_tag else ""
 
-        audio_url = ""
-        if data_id:
-            content_url = self.config.API_CONTENT_URL_TEMPLATE.format(data_id=data_id)
-            try:
-                content_response = self.session.get(content_url, timeout=10)
-                content_response.raise_for_status()
-                json_data = content_response.json()
-                audio_url = json_data["audio"][0]["contentUrl"][0]["@value"]
-            except (requests.RequestException, KeyError, IndexError):
-                logger.warning(
-                    f"  - Não foi possível obter a URL do áudio para a faixa '{titulo}' (ID: {data_id})."
-                )
-
         return {
             "data_id": data_id,
             "titulo": titulo,
@@ -164,10 +300,205 @@ class DiscografiaScraper:
             "data_gravacao": data_gravacao,
             "data_lancamento": data_lancamento,
             "fonte_url": fonte_url,
-            "audio_url": audio_url,
+            "audio_url": "",
         }
 
-    def _download_and_audit_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _fetch_audio_url(self, data_id: str, titulo: str) -> str:
+        """
+        Retrieves the audio URL of a single track from the content API.
+
+        Args:
+            data_id (str): The unique identifier of the track.
+            titulo (str): The title of the track, used only in log messages.
+
+        Returns:
+            str: The URL to the audio file, or an empty string if it could not be retrieved.
+
+        Notes:
+            - This method is called from worker threads by `_fill_audio_urls`; it only reads from the shared session.
+            - Warnings are logged if the audio URL cannot be retrieved from the content API, including when the
+              response has an unexpected shape, so a single bad track never aborts the extraction.
+        """
+        content_url = f"{_CONTENT_URL_PREFIX}{data_id}{_CONTENT_URL_SUFFIX}"
+        try:
+            content_response = self.session.get(
+                content_url, timeout=self.config.HTTP_TIMEOUT
+            )
+            content_response.raise_for_status()
+            json_data = content_response.json()
+            # Tracks without audio fall through the .get chain; only an unexpected payload shape raises
+            audio = json_data.get("audio") or [{}]
+            content_urls = audio[0].get("contentUrl") or [{}]
+            audio_url = content_urls[0].get("@value") or ""
+        except (
+            requests.RequestException,
+            ValueError,
+            KeyError,
+            IndexError,
+            TypeError,
+            AttributeError,
+        ):
+            audio_url = ""
+
+        if not audio_url:
+            logger.warning(
+                f"  - Não foi possível obter a URL do áudio para a faixa '{titulo}' (ID: {data_id})."
+            )
+        return audio_url
+
+    def _fill_audio_urls(
+        self,
+        songs: List[Dict[str, Any]],
+        resolved_urls: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Fills the 'audio_url' field of each track by querying the content API concurrently.
+
+        The content API is called once per track, so fetching the URLs one after the other makes the extraction time
+        grow with the number of tracks times the network round trip. This method dispatches the requests to a thread pool,
+        overlapping the waits on the network while reusing the scraper's HTTP session.
+
+        Args:
+            songs (List[Dict[str, Any]]): The track metadata dictionaries produced by `_parse_track_data`. Updated in place.
+            resolved_urls (Optional[Dict[str, str]]): The audio URLs already resolved in the current extraction, by
+                data-id. Data-ids found in it are not looked up again, and the URLs resolved here are added to it.
+
+        Returns:
+            None
+
+        Notes:
+            - Tracks without a data-id are left with an empty audio_url.
+            - The content API is queried once per distinct data-id; tracks repeated in the listing share the result.
+              Passing the same `resolved_urls` for every page extends this to tracks repeated across pages.
+            - When the cache is enabled, only data-ids missing from it are queried, and the URLs obtained are stored in it.
+            - The number of concurrent requests is limited by `config.CONTENT_API_MAX_WORKERS`.
+        """
+        titles_by_id = {}
+        for song in songs:
+            if song["data_id"]:
+                titles_by_id.setdefault(song["data_id"], song["titulo"])
+        if not titles_by_id:
+            return
+        if resolved_urls is None:
+            resolved_urls = {}
+
+        pending = [data_id for data_id in titles_by_id if data_id not in resolved_urls]
+        audio_urls = (
+            self.audio_url_cache.get_many(pending)
+            if self.audio_url_cache and pending
+            else {}
+        )
+        if audio_urls:
+            logger.info(f"{len(audio_urls)} URLs de áudio recuperadas do cache.")
+
+        missing = {
+            data_id: titles_by_id[data_id]
+            for data_id in pending
+            if data_id not in audio_urls
+        }
+        if missing:
+            max_workers = min(
+                self.config.CONTENT_API_MAX_WORKERS,
+                len(missing),
+                self.config.HTTP_POOL_SIZE,
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched = dict(
+                    zip(
+                        missing,
+                        executor.map(
+                            self._fetch_audio_url, missing.keys(), missing.values()
+                        ),
+                    )
+                )
+            audio_urls.update(fetched)
+            if self.audio_url_cache:
+                self.audio_url_cache.set_many(
+                    {data_id: url for data_id, url in fetched.items() if url}
+                )
+
+        resolved_urls.update(audio_urls)
+        for song in songs:
+            if song["data_id"]:
+                song["audio_url"] = resolved_urls[song["data_id"]]
+
+    def _download_audio(self, audio_url: str, filepath: Path, titulo: str) -> bool:
+        """
+        Downloads a single audio file.
+
+        Args:
+            audio_url (str): The URL of the audio file.
+            filepath (Path): The local path where the file is saved. Its parent directory must exist.
+            titulo (str): The title of the track, used only in log messages.
+
+        Returns:
+            bool: True if the file was downloaded, False if the download failed.
+
+        Notes:
+            - This method is called from worker threads by `_download_and_audit_dataframe`; it only reads from the
+              shared session.
+            - The response is written in blocks of `config.AUDIO_DOWNLOAD_CHUNK_SIZE` bytes, so a typical MP3 takes a
+              few Python iterations and write calls instead of hundreds.
+            - The file is written to a uniquely named '<name>.<random>.part' file in the same directory and renamed once
+              complete, so an interrupted or failed download never leaves a truncated MP3 that a later run would take
+              as already downloaded, and concurrent writers of the same file (another process on the same output
+              folder, or two tracks mapped to the same path) never truncate or delete each other's data.
+            - The response is always closed, returning its connection to the session pool even on errors.
+        """
+        logger.info(f"  - Baixando: '{titulo}'...")
+        # A unique temporary name per download; 'xb' never opens a file another writer is using
+        part_path = filepath.with_name(f"{filepath.name}.{uuid.uuid4().hex}.part")
+        try:
+            with closing(
+                self.session.get(
+                    audio_url, stream=True, timeout=self.config.HTTP_DOWNLOAD_TIMEOUT
+                )
+            ) as audio_response:
+                audio_response.raise_for_status()
+                with open(part_path, "xb") as f:
+                    for chunk in audio_response.iter_content(
+                        chunk_size=self.config.AUDIO_DOWNLOAD_CHUNK_SIZE
+                    ):
+                        f.write(chunk)
+            os.replace(part_path, filepath)
+            logger.info(f"    -> Sucesso ao baixar '{titulo}'.")
+            return True
+        except requests.RequestException as e:
+            logger.error(f"    -> Erro ao baixar '{titulo}': {e}")
+            return False
+        finally:
+            part_path.unlink(missing_ok=True)
+
+    def _copy_to_targets(self, targets: List[Tuple[Any, Path]]) -> List[Any]:
+        """
+        Copies a downloaded audio file to the other paths of the tracks that share its audio URL.
+
+        Args:
+            targets (List[Tuple[Any, Path]]): The (index, filepath) pairs of the tracks sharing the audio URL. The file
+                was downloaded to the path of the first pair.
+
+        Returns:
+            List[Any]: The indexes of the tracks whose file is now available locally.
+        """
+        downloaded_path = targets[0][1]
+        available = []
+        for index, filepath in targets:
+            if filepath != downloaded_path and not filepath.exists():
+                try:
+                    shutil.copyfile(downloaded_path, filepath)
+                except OSError as e:
+                    logger.error(f"    -> Erro ao copiar '{downloaded_path}': {e}")
+                    continue
+            available.append(index)
+        return available
+
+    def _download_and_audit_dataframe(
+        self,
+        df: pd.DataFrame,
+        progress_cb: Optional[ProgressCallback] = None,
+        max_workers: Optional[int] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> pd.DataFrame:
         """
         Downloads audio files from the URLs in the DataFrame and updates audit information for each track.
 
@@ -178,6 +509,12 @@ class DiscografiaScraper:
 
         Args:
             df (pd.DataFrame): DataFrame containing at least the columns 'audio_url', 'autor', 'titulo', and 'data_id'.
+            progress_cb (ProgressCallback, optional): Called as `progress_cb(n_done, n_total)` once before the first
+                track and as the tracks are found locally or finish downloading. Defaults to None.
+            max_workers (int, optional): The maximum number of concurrent downloads. Defaults to None, which uses
+                `config.AUDIO_DOWNLOAD_MAX_WORKERS`. Values above `config.HTTP_POOL_SIZE` are capped to it.
+            cancel_event (threading.Event, optional): When set, e.g. from another thread, the downloads not yet started
+                are skipped; the ones in progress finish and are audited. Defaults to None.
 
         Returns:
             pd.DataFrame: The updated DataFrame with audit information for each processed audio file, including the columns:
@@ -186,70 +523,150 @@ class DiscografiaScraper:
                 - data_download: The date the file was downloaded (dd/mm/yyyy), or empty if not downloaded.
 
         Notes:
-            - If the audio file already exists, it is not downloaded again, but the audit information is updated.
+            - If the audio file already exists, it is not downloaded again, but the audit information is updated. The
+              author folders are listed once to find the existing files.
+            - Each audio URL is downloaded once; tracks sharing it under another file name receive a local copy.
             - If the download fails, the corresponding audit columns are not updated for that row.
             - Progress and error messages are logged using the logger.
             - Files are saved under the output directory specified when initializing the scraper instance.
+            - The downloads run concurrently with `_download_audio`, limited by `max_workers`. Worker threads only
+              download; the DataFrame is updated from the calling thread.
+            - The number of workers never exceeds the connection pool size, so every worker keeps its own keep-alive
+              connection instead of opening and discarding extra ones.
+            - `progress_cb` is called from the thread running this method; callers driving a UI from another thread
+              should only hand the values over (e.g. through a queue) inside the callback.
+            - `cancel_event` is checked as each download starts. A cancelled run returns the partial audit, with
+              `data_download` empty for the tracks that were not downloaded.
         """
-        for col in ["pasta", "nome_arquivo", "data_download"]:
-            if col not in df.columns:
-                df[col] = pd.Series(dtype="object")
+        # Empty columns (e.g. all-NaN float columns of a fresh metadata frame) are replaced so they can hold text,
+        # all in a single assignment
+        colunas_vazias = [
+            col
+            for col in ["pasta", "nome_arquivo", "data_download"]
+            if col not in df.columns or df[col].isna().all()
+        ]
+        if colunas_vazias:
+            df[colunas_vazias] = pd.DataFrame(
+                index=df.index, columns=colunas_vazias, dtype="object"
+            )
 
         df_com_audio = df[df["audio_url"].notna() & (df["audio_url"] != "")].copy()
-        logger.info(f"\nEncontradas {len(df_com_audio)} músicas na lista para baixar.")
-
-        for index, row in df_com_audio.iterrows():
-            download_status = False
-            nome_pasta = "Autor Desconhecido"
-            nome_arquivo_final = ""
-            autores = str(row["autor"])
-            if pd.notna(autores) and autores:
-                primeiro_autor = autores.split(" / ")[0].strip()
-                nome_pasta = re.sub(r'[\\/*?:"<>|]', "", primeiro_autor)
-
-            download_path = Path(self.output_dir) / nome_pasta
-            os.makedirs(download_path, exist_ok=True)
-
-            titulo = str(row["titulo"])
-            data_id = row["data_id"]
-            titulo_sem_acentos = (
-                unicodedata.normalize("NFKD", titulo)
-                .encode("ASCII", "ignore")
-                .decode("utf-8")
-            )
-            titulo_limpo = re.sub(r"[^a-z0-9\s-]", "", titulo_sem_acentos.lower())
-            slug_titulo = re.sub(r"[\s-]+", "-", titulo_limpo).strip("-")
-            nome_arquivo_final = f"{slug_titulo}_{str(data_id)}.mp3"
-            filepath = download_path / nome_arquivo_final
+        n_total = len(df_com_audio)
+        logger.info(f"\nEncontradas {n_total} músicas na lista para baixar.")
+        if progress_cb:
+            progress_cb(0, n_total)
+
+        # Folder and file names are computed for all tracks at once with the vectorized string methods
+        autores = df_com_audio["autor"].fillna("").astype(str)
+        # Each distinct author string is turned into a folder name once
+        pastas_por_autor = {
+            autor: autor.split(" / ")[0].strip().translate(_INVALID_PATH_CHARS)
+            if autor
+            else "Autor Desconhecido"
+            for autor in autores.unique()
+        }
+        nomes_pastas = autores.map(pastas_por_autor)
+        titulos = df_com_audio["titulo"].fillna("").astype(str)
+        # Likewise, each distinct title (the same song is often recorded many times) is slugified once
+        titulos_unicos = pd.Series(titulos.unique(), dtype=object)
+        slugs_unicos = (
+            titulos_unicos.str.normalize("NFKD")
+            .str.encode("ascii", "ignore")
+            .str.decode("utf-8")
+            .str.lower()
+            .str.replace(_RE_NON_SLUG_CHARS, "", regex=True)
+            .str.replace(_RE_SLUG_SEPARATORS, "-", regex=True)
+            .str.strip("-")
+        )
+        slugs_titulos = titulos.map(dict(zip(titulos_unicos, slugs_unicos)))
+        nomes_arquivos = (
+            slugs_titulos + "_" + df_com_audio["data_id"].astype(str) + ".mp3"
+        )
 
-            if os.path.exists(filepath):
+        # Each author folder is created and listed once, instead of one makedirs and one stat call per track
+        download_paths = {}
+        existing_files = {}
+        for nome_pasta in nomes_pastas.unique():
+            download_path = download_paths[nome_pasta] = self.output_dir / nome_pasta
+            download_path.mkdir(parents=True, exist_ok=True)
+            with os.scandir(download_path) as entries:
+                existing_files[nome_pasta] = {
+                    entry.name for entry in entries if entry.is_file()
+                }
+
+        # Only the missing files are dispatched to the thread pool; tracks sharing an audio URL share a single download
+        downloaded = []
+        download_tasks = {}
+        for index, audio_url, nome_pasta, nome_arquivo_final, titulo in zip(
+            df_com_audio.index,
+            df_com_audio["audio_url"].astype(str),
+            nomes_pastas,
+            nomes_arquivos,
+            titulos,
+        ):
+            if nome_arquivo_final in existing_files[nome_pasta]:
                 logger.info(f"  - Já existe: '{titulo}'. Marcando como sucesso.")
-                download_status = True
-            else:
-                logger.info(f"  - Baixando: '{titulo}'...")
-                try:
-                    audio_response = self.session.get(
-                        str(row["audio_url"]), stream=True, timeout=20
-                    )
-                    audio_response.raise_for_status()
-                    with open(filepath, "wb") as f:
-                        for chunk in audio_response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    logger.info("    -> Sucesso ao baixar.")
-                    download_status = True
-                except requests.RequestException as e:
-                    logger.error(f"    -> Erro ao baixar: {e}")
-                    download_status = False
+                downloaded.append(index)
+                continue
+            filepath = download_paths[nome_pasta] / nome_arquivo_final
+            if audio_url not in download_tasks:
+                download_tasks[audio_url] = (titulo, [])
+            download_tasks[audio_url][1].append((index, filepath))
+
+        # The audit columns are assigned once for all rows instead of one .loc write per row
+        df.loc[df_com_audio.index, "pasta"] = nomes_pastas
+        df.loc[df_com_audio.index, "nome_arquivo"] = nomes_arquivos
+
+        n_done = len(downloaded)
+        if progress_cb and n_done:
+            progress_cb(n_done, n_total)
+
+        if download_tasks:
+            n_workers = min(
+                max_workers or self.config.AUDIO_DOWNLOAD_MAX_WORKERS,
+                len(download_tasks),
+                self.config.HTTP_POOL_SIZE,
+            )
 
-            data_de_hoje = datetime.now().strftime("%d/%m/%Y")
-            df.loc[index, "pasta"] = nome_pasta
-            df.loc[index, "nome_arquivo"] = nome_arquivo_final
-            if download_status:
-                df.loc[index, "data_download"] = data_de_hoje
+            def download_unless_cancelled(
+                audio_url: str, filepath: Path, titulo: str
+            ) -> Optional[bool]:
+                # Checked in the worker as the download starts, so no download begins after the event is set
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+                return self._download_audio(audio_url, filepath, titulo)
+
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                futures = {
+                    executor.submit(
+                        download_unless_cancelled, audio_url, targets[0][1], titulo
+                    ): targets
+                    for audio_url, (titulo, targets) in download_tasks.items()
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result is None:
+                        continue
+                    targets = futures[future]
+                    if result:
+                        downloaded.extend(self._copy_to_targets(targets))
+                    n_done += len(targets)
+                    if progress_cb:
+                        progress_cb(n_done, n_total)
+
+            if cancel_event is not None and cancel_event.is_set():
+                logger.warning(
+                    f"Download cancelado: {n_done} de {n_total} músicas processadas."
+                )
+
+        data_de_hoje = datetime.now().strftime("%d/%m/%Y")
+        df.loc[downloaded, "data_download"] = data_de_hoje
 
         return df
 
-    def _save_metadata_to_csv(self, data: List[Dict[str, Any]], filename: str) -> None:
+    def _save_metadata_to_csv(
+        self, data: List[Dict[str, Any]], filename: str
+    ) -> Optional[pd.DataFrame]:
         """
         Saves a list of track metadata dictionaries as a CSV file in the output directory.
 
@@ -262,7 +679,7 @@ class DiscografiaScraper:
             filename (str): The name of the output CSV file (should include the .csv extension).
 
         Returns:
-            None
+            Optional[pd.DataFrame]: The saved metadata, or None if the data list is empty.
 
         Notes:
             - The output CSV file is saved in the output directory specified when initializing the scraper instance.
@@ -273,17 +690,18 @@ class DiscografiaScraper:
         """
         if not data:
             logger.warning("Nenhum dado foi extraído. O arquivo CSV não será gerado.")
-            return
+            return None
 
-        df = pd.DataFrame(data)
-        df = df.reindex(columns=self.config.OUTPUT_COLUMNS)
+        # Selecting the columns in the constructor avoids building the full frame and copying it in a reindex
+        df = pd.DataFrame(data, columns=self.config.OUTPUT_COLUMNS)
 
         os.makedirs(self.output_dir, exist_ok=True)
         filepath = Path(self.output_dir) / filename
-        df.to_csv(filepath, index=False, encoding="utf-8-sig")
+        write_report(df, filepath)
 
         logger.info("\n--- Extração Concluída ---")
         logger.info(f"Os metadados foram salvos com sucesso em: {filepath}")
+        return df
 
     def _extract_playlist_data(
         self, playlist_id: str, limit: int = 9999
@@ -292,8 +710,8 @@ class DiscografiaScraper:
         Extracts detailed metadata for all tracks in a given playlist from the Discografia Brasileira website.
 
         This method fetches the playlist page, parses the HTML to extract track information for each song using the
-        internal helper method `_parse_track_data`, and returns a list of dictionaries with all relevant metadata. For each track,
-        it attempts to retrieve the audio URL by making an additional request to the content API if a data-id is present.
+        internal helper method `_parse_track_data`, and returns a list of dictionaries with all relevant metadata. The audio URLs
+        are then retrieved concurrently from the content API by `_fill_audio_urls` for every track with a data-id.
 
         Args:
             playlist_id (str): The unique identifier of the playlist on the Discografia Brasileira website.
@@ -324,13 +742,18 @@ class DiscografiaScraper:
 
         logger.info(f"Buscando dados da playlist ID: {playlist_id}...")
         try:
-            response = self.session.get(tracklist_url)
+            # The whole tracklist is rendered before the first byte is sent, so it gets a longer read timeout
+            response = self.session.get(
+                tracklist_url, timeout=self.config.HTTP_LISTING_TIMEOUT
+            )
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
-            tracks = soup.find_all("div", class_="track")
+            soup = BeautifulSoup(response.content, "lxml", parse_only=_TRACKS_ONLY)
+            # Every top-level element left by the strainer is a track
+            tracks = soup.find_all(recursive=False)
             logger.info(f"Encontradas {len(tracks)} faixas. Extraindo detalhes...")
 
             all_songs_data = [self._parse_track_data(track) for track in tracks]
+            self._fill_audio_urls(all_songs_data)
 
         except requests.RequestException as e:
             logger.error(f"Erro fatal ao buscar a lista de faixas: {e}")
@@ -410,56 +833,77 @@ class DiscografiaScraper:
                     - audio_url (str): The URL to the audio file, if available.
 
         Workflow:
-            1. Fetches the initial filter URL and parses the HTML for track elements.
+            1. Fetches the initial filter URL and parses only the track elements and pagination links of the HTML.
             2. For each track, extracts metadata using `_parse_track_data`.
-            3. Follows the "Next" page link if present, repeating the process until no more pages are found.
-            4. Returns a list of all extracted track metadata dictionaries.
+            3. Retrieves the audio URLs of the page's tracks with `_fill_audio_urls`, in a background thread.
+            4. Follows the "Next" page link if present, repeating the process until no more pages are found.
+            5. Waits for the audio URLs of all pages and returns a list of all extracted track metadata dictionaries.
 
         Notes:
             - This method is generic and can be used for any paginated track listing on the Discografia Brasileira website.
+            - The content API requests of one page overlap with the download of the next page. Pages are filled one at
+              a time and share the audio URLs already resolved, so a data-id listed by an earlier page is not queried
+              again, even with the cache disabled.
             - If no tracks are found or an error occurs, an empty list is returned.
             - Progress, warnings, and errors are logged using the logger.
         """
         all_songs_data = []
         next_page_url = filter_url
 
-        page_num = 1
-        while next_page_url:
-            logger.info(f"Buscando dados da URL (página {page_num})...")
-            try:
-                response = self.session.get(next_page_url)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-                tracks = soup.find_all("div", class_="track")
-                if not tracks:
+        # The audio URLs of each page are retrieved in the background while the next page is fetched
+        with ThreadPoolExecutor(max_workers=1) as audio_url_filler:
+            pending_pages = []
+            # Shared by all pages, so a track listed on several pages is resolved only once
+            resolved_urls = {}
+            page_num = 1
+            while next_page_url:
+                logger.info(f"Buscando dados da URL (página {page_num})...")
+                try:
+                    response = self.session.get(
+                        next_page_url, timeout=self.config.HTTP_LISTING_TIMEOUT
+                    )
+                    response.raise_for_status()
+                    soup = BeautifulSoup(
+                        response.content, "lxml", parse_only=_TRACKS_AND_PAGINATION
+                    )
+                    tracks = soup.find_all("div", class_="track", recursive=False)
+                    if not tracks:
+                        logger.info(
+                            "Nenhuma faixa encontrada nesta página. Encerrando a busca."
+                        )
+                        break
+
                     logger.info(
-                        "Nenhuma faixa encontrada nesta página. Encerrando a busca."
+                        f"Encontradas {len(tracks)} faixas na página {page_num}. Extraindo detalhes..."
                     )
-                    break
 
-                logger.info(
-                    f"Encontradas {len(tracks)} faixas na página {page_num}. Extraindo detalhes..."
-                )
+                    page_songs = [self._parse_track_data(track) for track in tracks]
+                    all_songs_data.extend(page_songs)
+                    pending_pages.append(
+                        audio_url_filler.submit(
+                            self._fill_audio_urls, page_songs, resolved_urls
+                        )
+                    )
 
-                for track in tracks:
-                    all_songs_data.append(self._parse_track_data(track))
+                    next_page_tag = _SEL_NEXT_PAGE.select_one(soup)
+                    if next_page_tag and next_page_tag.has_attr("href"):
+                        next_page_url = next_page_tag["href"]
+                        page_num += 1
+                    else:
+                        next_page_url = None
 
-                next_page_tag = soup.select_one(
-                    'span.pagination-item a[aria-label="Next"]'
-                )
-                if next_page_tag and next_page_tag.has_attr("href"):
-                    next_page_url = next_page_tag["href"]
-                    page_num += 1
-                else:
-                    next_page_url = None
+                except requests.RequestException as e:
+                    logger.error(f"Erro fatal ao buscar a página: {e}")
+                    break
 
-            except requests.RequestException as e:
-                logger.error(f"Erro fatal ao buscar a página: {e}")
-                break
+            for pending_page in pending_pages:
+                pending_page.result()
 
         return all_songs_data
     
-    def save_playlist_to_csv(self, playlist_id: str, limit: int = 9999) -> None:
+    def save_playlist_to_csv(
+        self, playlist_id: str, limit: int = 9999
+    ) -> Optional[pd.DataFrame]:
         """
         Extracts metadata for all tracks in a given playlist and saves it as a CSV file in the output directory.
 
@@ -473,7 +917,8 @@ class DiscografiaScraper:
             limit (int, optional): The maximum number of tracks to extract. Defaults to 9999.
 
         Returns:
-            None
+            Optional[pd.DataFrame]: The saved metadata, which can be passed to `download_from_csv` to skip reading the
+                file back, or None if no tracks were found.
 
         Notes:
             - The output CSV file is named 'playlist_{playlist_id}_metadata.csv' and is saved in the output directory of the scraper instance.
@@ -488,9 +933,9 @@ class DiscografiaScraper:
         dados_musicas = self._extract_playlist_data(playlist_id=playlist_id, limit=limit)
 
         filename = f"playlist_{playlist_id}_metadata.csv"
-        self._save_metadata_to_csv(dados_musicas, filename)
+        return self._save_metadata_to_csv(dados_musicas, filename)
 
-    def save_author_to_csv(self, author_name: str) -> None:
+    def save_author_to_csv(self, author_name: str) -> Optional[pd.DataFrame]:
         """
         Extracts metadata for all tracks by a given author and saves it as a CSV file in the output directory.
 
@@ -503,7 +948,8 @@ class DiscografiaScraper:
             author_name (str): The name of the author whose tracks should be extracted.
 
         Returns:
-            None
+            Optional[pd.DataFrame]: The saved metadata, which can be passed to `download_from_csv` to skip reading the
+                file back, or None if no tracks were found.
 
         Notes:
             - The output CSV file is named 'author_{author_name}_metadata.csv', with a sanitized author name, and is saved in the output directory of the scraper instance.
@@ -517,11 +963,13 @@ class DiscografiaScraper:
         )
 
         dados_musicas = self._extract_author_data(author_name)
-        safe_name = re.sub(r'[\\/*?:"<>|]', "", author_name).replace(" ", "_").lower()
+        safe_name = _safe_report_name(author_name)
         filename = f"author_{safe_name}_metadata.csv"
-        self._save_metadata_to_csv(dados_musicas, filename)
+        return self._save_metadata_to_csv(dados_musicas, filename)
 
-    def save_filter_to_csv(self, filter_url: str, report_name: str) -> None:
+    def save_filter_to_csv(
+        self, filter_url: str, report_name: str
+    ) -> Optional[pd.DataFrame]:
         """
         Extracts track metadata from a generic filter URL and saves it as a CSV file in the output directory.
 
@@ -534,7 +982,8 @@ class DiscografiaScraper:
             report_name (str): The name to use for the output CSV file (will be sanitized and used in the filename).
 
         Returns:
-            None
+            Optional[pd.DataFrame]: The saved metadata, which can be passed to `download_from_csv` to skip reading the
+                file back, or None if no tracks were found.
 
         Notes:
             - The output CSV file is named 'filter_{report_name}_metadata.csv', with a sanitized report name, and is saved in the output directory of the scraper instance.
@@ -548,11 +997,18 @@ class DiscografiaScraper:
 
         dados_musicas = self._extract_data_from_url(filter_url)
 
-        safe_name = re.sub(r'[\\/*?:"<>|]', "", report_name).replace(" ", "_").lower()
+        safe_name = _safe_report_name(report_name)
         filename = f"filter_{safe_name}_metadata.csv"
-        self._save_metadata_to_csv(dados_musicas, filename)
+        return self._save_metadata_to_csv(dados_musicas, filename)
 
-    def download_from_csv(self, input_csv_path: str) -> None:
+    def download_from_csv(
+        self,
+        input_csv_path: str,
+        progress_cb: Optional[ProgressCallback] = None,
+        df: Optional[pd.DataFrame] = None,
+        max_workers: Optional[int] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> None:
         """
         Reads a CSV file (potentially edited by the user), downloads audio files, and saves a new audit CSV in the same directory.
 
@@ -562,6 +1018,14 @@ class DiscografiaScraper:
 
         Args:
             input_csv_path (str): The path to the input CSV file containing track metadata and audio URLs.
+            progress_cb (ProgressCallback, optional): Called as `progress_cb(n_done, n_total)` while the audio files
+                are downloaded. Defaults to None.
+            df (pd.DataFrame, optional): The contents of `input_csv_path` already in memory, e.g. as returned by
+                `save_playlist_to_csv`. When given, the file is not read again. Defaults to None.
+            max_workers (int, optional): The maximum number of concurrent downloads. Defaults to None, which uses
+                `config.AUDIO_DOWNLOAD_MAX_WORKERS`.
+            cancel_event (threading.Event, optional): When set, the downloads not yet started are cancelled and the
+                audit is saved with the partial results. Defaults to None.
 
         Returns:
             None
@@ -577,23 +1041,31 @@ class DiscografiaScraper:
             - Only tracks with a non-empty 'audio_url' are processed for download.
             - Progress and status messages are logged using the logger.
             - This method is intended to be used as part of the download and audit workflow from user-supplied or previously exported CSVs.
+            - Parquet ('.parquet') and Feather ('.feather') inputs are also accepted; the audit file keeps the input format.
         """
         logger.info("\n--- Iniciando Etapa 2: Download a partir de CSV ---")
-        try:
-            df = pd.read_csv(input_csv_path, dtype=self.config.COLUMN_DTYPES)
-            logger.info(f"Lendo dados de: {input_csv_path}")
-        except FileNotFoundError:
-            logger.error(f"Erro: O arquivo CSV '{input_csv_path}' não foi encontrado.")
-            return
+        if df is None:
+            try:
+                df = read_report(input_csv_path)
+                logger.info(f"Lendo dados de: {input_csv_path}")
+            except FileNotFoundError:
+                logger.error(
+                    f"Erro: O arquivo CSV '{input_csv_path}' não foi encontrado."
+                )
+                return
+        else:
+            df = df.copy()
 
-        df_audit = self._download_and_audit_dataframe(df)
+        df_audit = self._download_and_audit_dataframe(
+            df, progress_cb, max_workers, cancel_event
+        )
 
         p = Path(input_csv_path)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         new_filename = f"{p.stem}_{timestamp}{p.suffix}"
         new_filepath = p.parent / new_filename
 
-        df_audit.to_csv(new_filepath, index=False, encoding="utf-8-sig")
+        write_report(df_audit, new_filepath)
         logger.info("\n--- Processo de Download Concluído ---")
         logger.info(f"O relatório de auditoria foi salvo em: {new_filepath}")
 
@@ -604,6 +1076,9 @@ class DiscografiaScraper:
         save_report: bool = True,
         report_xlsx: bool = False,
         report_columns: list = None,
+        progress_cb: Optional[ProgressCallback] = None,
+        max_workers: Optional[int] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> None:
         """
         Executes the complete workflow for a playlist: extracts track metadata, downloads audio files, and optionally saves a final audit report (CSV or XLSX) in the output directory.
@@ -620,6 +1095,9 @@ class DiscografiaScraper:
             save_report (bool, optional): If True, saves the final report (CSV or XLSX) with metadata and download results. If False, no report is saved. Defaults to True.
             report_xlsx (bool, optional): If True and save_report is True, saves the report as an XLSX file instead of CSV. Defaults to False.
             report_columns (list, optional): List of columns to include in the final report. If None, uses the default columns from configuration.
+            progress_cb (ProgressCallback, optional): Called as `progress_cb(n_done, n_total)` while the audio files are downloaded. Defaults to None.
+            max_workers (int, optional): The maximum number of concurrent downloads. Defaults to None, which uses `config.AUDIO_DOWNLOAD_MAX_WORKERS`.
+            cancel_event (threading.Event, optional): When set, the downloads not yet started are cancelled and the report is saved with the partial results. Defaults to None.
 
         Returns:
             None
@@ -643,8 +1121,10 @@ class DiscografiaScraper:
             logger.warning("Nenhuma música foi extraída. Encerrando o processo.")
             return
 
-        df = pd.DataFrame(dados_musicas)
-        df_audit = self._download_and_audit_dataframe(df)
+        df = pd.DataFrame(dados_musicas, columns=self.config.OUTPUT_COLUMNS)
+        df_audit = self._download_and_audit_dataframe(
+            df, progress_cb, max_workers, cancel_event
+        )
 
         if save_report:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -656,14 +1136,11 @@ class DiscografiaScraper:
                 if report_columns is not None
                 else self.config.OUTPUT_COLUMNS
             )
-            df_audit = df_audit.reindex(columns=columns_to_save)
+            df_audit = _select_report_columns(df_audit, columns_to_save)
 
-            if report_xlsx:
-                df_audit.to_excel(filepath.with_suffix(".xlsx"), index=False)
-            else:
-                df_audit.to_csv(
-                    filepath.with_suffix(".csv"), index=False, encoding="utf-8-sig"
-                )
+            write_report(
+                df_audit, filepath.with_suffix(".xlsx" if report_xlsx else ".csv")
+            )
 
             logger.info("\n--- Processo de Download Concluído ---")
             logger.info(f"O relatório final foi salvo em: {filepath}")
@@ -677,6 +1154,9 @@ class DiscografiaScraper:
         save_report: bool = True,
         report_xlsx: bool = False,
         report_columns: list = None,
+        progress_cb: Optional[ProgressCallback] = None,
+        max_workers: Optional[int] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> None:
         """
         Executes the complete workflow for an author: extracts track metadata, downloads audio files, and optionally saves a final audit report (CSV or XLSX) in the output directory.
@@ -692,6 +1172,9 @@ class DiscografiaScraper:
             save_report (bool, optional): If True, saves the final report (CSV or XLSX) with metadata and download results. If False, no report is saved. Defaults to True.
             report_xlsx (bool, optional): If True and save_report is True, saves the report as an XLSX file instead of CSV. Defaults to False.
             report_columns (list, optional): List of columns to include in the final report. If None, uses the default columns from configuration.
+            progress_cb (ProgressCallback, optional): Called as `progress_cb(n_done, n_total)` while the audio files are downloaded. Defaults to None.
+            max_workers (int, optional): The maximum number of concurrent downloads. Defaults to None, which uses `config.AUDIO_DOWNLOAD_MAX_WORKERS`.
+            cancel_event (threading.Event, optional): When set, the downloads not yet started are cancelled and the report is saved with the partial results. Defaults to None.
 
         Returns:
             None
@@ -716,14 +1199,14 @@ class DiscografiaScraper:
             logger.warning("Nenhuma música foi extraída. Encerrando o processo.")
             return
 
-        df = pd.DataFrame(dados_musicas)
-        df_audit = self._download_and_audit_dataframe(df)
+        df = pd.DataFrame(dados_musicas, columns=self.config.OUTPUT_COLUMNS)
+        df_audit = self._download_and_audit_dataframe(
+            df, progress_cb, max_workers, cancel_event
+        )
 
         if save_report:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_author_name = (
-                re.sub(r'[\\/*?:"<>|]', "", author_name).replace(" ", "_").lower()
-            )
+            safe_author_name = _safe_report_name(author_name)
             filename = f"author_{safe_author_name}_{timestamp}.csv"
             filepath = Path(self.output_dir) / filename
 
@@ -732,14 +1215,11 @@ class DiscografiaScraper:
                 if report_columns is not None
                 else self.config.OUTPUT_COLUMNS
             )
-            df_audit = df_audit.reindex(columns=columns_to_save)
+            df_audit = _select_report_columns(df_audit, columns_to_save)
 
-            if report_xlsx:
-                df_audit.to_excel(filepath.with_suffix(".xlsx"), index=False)
-            else:
-                df_audit.to_csv(
-                    filepath.with_suffix(".csv"), index=False, encoding="utf-8-sig"
-                )
+            write_report(
+                df_audit, filepath.with_suffix(".xlsx" if report_xlsx else ".csv")
+            )
 
             logger.info("\n--- Processo de Download Concluído ---")
             logger.info(
@@ -755,6 +1235,9 @@ class DiscografiaScraper:
         save_report: bool = True,
         report_xlsx: bool = False,
         report_columns: list = None,
+        progress_cb: Optional[ProgressCallback] = None,
+        max_workers: Optional[int] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> None:
         """
         Executes the complete workflow for a generic filter: extracts track metadata, downloads audio files, and optionally saves a final audit report (CSV or XLSX) in the output directory.
@@ -771,6 +1254,9 @@ class DiscografiaScraper:
             save_report (bool, optional): If True, saves the final report (CSV or XLSX) with metadata and download results. If False, no report is saved. Defaults to True.
             report_xlsx (bool, optional): If True and save_report is True, saves the report as an XLSX file instead of CSV. Defaults to False.
             report_columns (list, optional): List of columns to include in the final report. If None, uses the default columns from configuration.
+            progress_cb (ProgressCallback, optional): Called as `progress_cb(n_done, n_total)` while the audio files are downloaded. Defaults to None.
+            max_workers (int, optional): The maximum number of concurrent downloads. Defaults to None, which uses `config.AUDIO_DOWNLOAD_MAX_WORKERS`.
+            cancel_event (threading.Event, optional): When set, the downloads not yet started are cancelled and the report is saved with the partial results. Defaults to None.
 
         Returns:
             None
@@ -795,14 +1281,14 @@ class DiscografiaScraper:
             logger.warning("Nenhuma música foi extraída. Encerrando o processo.")
             return
 
-        df = pd.DataFrame(dados_musicas)
-        df_audit = self._download_and_audit_dataframe(df)
+        df = pd.DataFrame(dados_musicas, columns=self.config.OUTPUT_COLUMNS)
+        df_audit = self._download_and_audit_dataframe(
+            df, progress_cb, max_workers, cancel_event
+        )
 
         if save_report:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_name = (
-                re.sub(r'[\\/*?:"<>|]', "", report_name).replace(" ", "_").lower()
-            )
+            safe_name = _safe_report_name(report_name)
             filename = f"filter_{safe_name}_{timestamp}.csv"
             filepath = Path(self.output_dir) / filename
 
@@ -811,14 +1297,11 @@ class DiscografiaScraper:
                 if report_columns is not None
                 else self.config.OUTPUT_COLUMNS
             )
-            df_audit = df_audit.reindex(columns=columns_to_save)
+            df_audit = _select_report_columns(df_audit, columns_to_save)
 
-            if report_xlsx:
-                df_audit.to_excel(filepath.with_suffix(".xlsx"), index=False)
-            else:
-                df_audit.to_csv(
-                    filepath.with_suffix(".csv"), index=False, encoding="utf-8-sig"
-                )
+            write_report(
+                df_audit, filepath.with_suffix(".xlsx" if report_xlsx else ".csv")
+            )
 
             logger.info("\n--- Processo de Download Concluído ---")
             logger.info(
@@ -1,6 +1,11 @@
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from openpyxl import Workbook
 from pathlib import Path
+import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List
 
@@ -8,43 +13,168 @@ from . import config
 
 logger = logging.getLogger(__name__)
 
+# The report columns are always parsed as strings; the options are built once and shared by every CSV read
+_CSV_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    column_types={name: pa.string() for name in config.COLUMN_DTYPES},
+    strings_can_be_null=True,
+)
 
-def merge_reports(file_paths: List[str], output_path: str) -> str:
+
+def _read_csv_arrow(file_path: str) -> pd.DataFrame:
+    """
+    Reads a CSV report with PyArrow's multithreaded CSV reader, keeping the strings in Arrow memory.
+
+    The columns listed in `config.COLUMN_DTYPES` are parsed directly as strings, so values such as IDs or years are
+    never converted to numbers and back (which would drop leading zeros). Empty fields are read as missing values.
+
+    Args:
+        file_path (str): The path to the CSV file.
+
+    Returns:
+        pd.DataFrame: The file contents, with Arrow-backed columns.
+    """
+    table = pacsv.read_csv(file_path, convert_options=_CSV_CONVERT_OPTIONS)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def read_report(file_path: str) -> pd.DataFrame:
+    """
+    Reads a track report saved as CSV, Parquet or Feather, choosing the reader from the file extension.
+
+    Args:
+        file_path (str): The path to the report file ('.csv', '.parquet' or '.feather').
+
+    Returns:
+        pd.DataFrame: The report contents, with Arrow-backed columns. CSV files are read with the columns of
+            `config.COLUMN_DTYPES` as strings.
+
+    Notes:
+        - Any extension other than '.parquet' or '.feather' is read as CSV, using `_read_csv_arrow`.
+        - Parquet and Feather files keep their column types, so no dtype mapping is applied.
+    """
+    suffix = Path(file_path).suffix.lower()
+    if suffix == ".parquet":
+        return pd.read_parquet(file_path, dtype_backend="pyarrow")
+    if suffix == ".feather":
+        return pd.read_feather(file_path, dtype_backend="pyarrow")
+    return _read_csv_arrow(file_path)
+
+
+def _write_xlsx(df: pd.DataFrame, file_path: str) -> None:
+    """
+    Writes a DataFrame to an XLSX file using openpyxl in write-only mode.
+
+    Rows are streamed to the worksheet one at a time, so memory stays flat and the workbook is written much faster
+    than through `DataFrame.to_excel`, which builds every cell in memory before saving.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to write. The index is not written.
+        file_path (str): The destination '.xlsx' path.
+
+    Returns:
+        None
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(list(df.columns))
+    # Missing values become empty cells, as with to_excel
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        ws.append(row)
+    wb.save(file_path)
+
+
+def write_report(df: pd.DataFrame, file_path: str) -> None:
     """
-    Merges multiple CSV report files into a single unified file, removing duplicate tracks by 'data_id'.
+    Writes a track report as CSV, Parquet, Feather or XLSX, choosing the writer from the file extension.
 
-    This function reads a list of CSV files containing track metadata, concatenates them into a single DataFrame,
+    Args:
+        df (pd.DataFrame): The report to write.
+        file_path (str): The destination path ('.csv', '.parquet', '.feather' or '.xlsx').
+
+    Returns:
+        None
+
+    Notes:
+        - Parquet files are compressed with Zstandard; they are smaller and much faster to reload than CSV.
+        - XLSX files are streamed with openpyxl's write-only mode (see `_write_xlsx`).
+        - Any other extension is written as CSV with a UTF-8 BOM, so Excel opens it correctly. The rows are formatted in
+          blocks of `config.CSV_WRITE_CHUNK_SIZE`, which keeps memory flat on large reports.
+        - The report is written to a temporary file next to the destination and moved into place once complete, so an
+          interrupted or failed write never leaves a truncated report (or replaces a previous one).
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+    try:
+        if suffix == ".parquet":
+            df.to_parquet(tmp_path, compression="zstd", index=False)
+        elif suffix == ".feather":
+            df.reset_index(drop=True).to_feather(tmp_path)
+        elif suffix == ".xlsx":
+            _write_xlsx(df, tmp_path)
+        else:
+            df.to_csv(
+                tmp_path,
+                index=False,
+                encoding="utf-8-sig",
+                chunksize=config.CSV_WRITE_CHUNK_SIZE,
+            )
+        os.replace(tmp_path, file_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def merge_reports(
+    file_paths: List[str], output_path: str, save_as_csv: bool = False
+) -> str:
+    """
+    Merges multiple report files into a single unified report, removing duplicate tracks by 'data_id'.
+
+    This function reads a list of report files (CSV, Parquet or Feather) containing track metadata, concatenates them into a single DataFrame,
     removes duplicate entries based on the 'data_id' column (keeping the first occurrence), and saves the resulting
-    unified report as a new CSV file in the specified output directory. The output file is timestamped to avoid overwriting.
+    unified report as a new Parquet (or CSV) file in the specified output directory. The output file is timestamped to avoid overwriting.
 
     Args:
-        file_paths (List[str]): A list of file paths to the CSV report files to be merged.
-        output_path (str): The directory where the unified CSV file will be saved.
+        file_paths (List[str]): A list of file paths to the report files to be merged.
+        output_path (str): The directory where the unified report will be saved.
+        save_as_csv (bool, optional): If True, saves the unified report as CSV instead of Parquet. Defaults to False.
 
     Returns:
-        str: The full path to the generated unified CSV file, or an empty string if the operation fails.
+        str: The full path to the generated unified report, or an empty string if the operation fails.
 
     Workflow:
-        1. Reads each CSV file in the provided list, skipping files that cannot be read.
+        1. Reads the files in the provided list concurrently with `read_report`, skipping files that cannot be read.
         2. Concatenates all successfully read DataFrames into a single DataFrame.
         3. Removes duplicate rows based on the 'data_id' column, keeping only the first occurrence.
-        4. Saves the deduplicated DataFrame as a new CSV file in the output directory, with a timestamp in the filename.
-        5. Returns the path to the unified CSV file, or an empty string if no files could be merged.
+        4. Saves the deduplicated DataFrame with `write_report` as a new file in the output directory, with a
+           timestamp in the filename.
+        5. Returns the path to the unified report, or an empty string if no files could be merged.
 
     Notes:
         - If no file paths are provided or none of the files can be read, the function returns an empty string.
-        - The output file is named 'relatorio_unificado_<timestamp>.csv'.
+        - The output file is named 'relatorio_unificado_<timestamp>.parquet' ('.csv' if `save_as_csv` is True).
+          Parquet keeps the column types and is much smaller and faster to read back in a later merge.
         - Progress, warnings, and errors are logged using the logger.
         - The function expects all input files to have a 'data_id' column for deduplication.
+        - Up to `config.REPORT_READ_MAX_WORKERS` files are read at once; the Arrow readers release the GIL, so disk
+          reads and parsing of different files overlap.
     """
     if not file_paths:
         logger.warning("Nenhuma lista de arquivos foi fornecida para a união.")
         return ""
 
+    # The files are read concurrently, but collected in the given order so the first copy of each track is kept
     all_dfs = []
-    for file_path in file_paths:
+    max_workers = min(config.REPORT_READ_MAX_WORKERS, len(file_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending_reads = [
+            (file_path, executor.submit(read_report, file_path))
+            for file_path in file_paths
+        ]
+    for file_path, pending_read in pending_reads:
         try:
-            df = pd.read_csv(file_path, dtype=config.COLUMN_DTYPES)
+            df = pending_read.result()
             all_dfs.append(df)
             logger.info(f"Lido com sucesso o arquivo: {file_path}")
         except FileNotFoundError:
@@ -55,10 +185,13 @@ def merge_reports(file_paths: List[str], output_path: str) -> str:
             continue
 
     if not all_dfs:
-        logger.error("Nenhum arquivo CSV pôde ser lido. A união foi cancelada.")
+        logger.error("Nenhum relatório pôde ser lido. A união foi cancelada.")
         return ""
 
-    merged_df = pd.concat(all_dfs, ignore_index=True)
+    # A single report is deduplicated as is, without going through concat
+    merged_df = (
+        all_dfs[0] if len(all_dfs) == 1 else pd.concat(all_dfs, ignore_index=True)
+    )
     logger.info(f"Total de registros antes da remoção de duplicatas: {len(merged_df)}")
 
     deduplicated_df = merged_df.drop_duplicates(subset=["data_id"], keep="first")
@@ -67,10 +200,11 @@ def merge_reports(file_paths: List[str], output_path: str) -> str:
     )
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_filename = f"relatorio_unificado_{timestamp}.csv"
+    output_suffix = ".csv" if save_as_csv else ".parquet"
+    output_filename = f"relatorio_unificado_{timestamp}{output_suffix}"
     output_filepath = Path(output_path) / output_filename
 
-    deduplicated_df.to_csv(output_filepath, index=False, encoding="utf-8-sig")
+    write_report(deduplicated_df, output_filepath)
     logger.info(f"Relatório unificado salvo com sucesso em: {output_filepath}")
 
     return str(output_filepath)
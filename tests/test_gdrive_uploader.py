@@ -0,0 +1,165 @@
+import os
+
+import pandas as pd
+import pytest
+from src.db_scraper import gdrive_uploader, paths
+from src.db_scraper.tools import read_report, write_report
+
+MOCK_AUDIT = pd.DataFrame(
+    {
+        "data_id": ["62582"],
+        "titulo": ["É Mato"],
+        "pasta": ["Wilson Batista"],
+        "nome_arquivo": ["e-mato_62582.mp3"],
+    }
+)
+
+
+def make_drive(mocker, existing_files=None):
+    """
+    Builds a GoogleDrive double with no folders and, in every author folder, the given files (title -> URL).
+    """
+    existing_files = existing_files or {}
+
+    def list_file(params):
+        if "application/vnd.google-apps.folder" in params["q"]:
+            items = []
+        else:
+            items = [
+                {"title": title, "alternateLink": url}
+                for title, url in existing_files.items()
+            ]
+        return mocker.Mock(GetList=mocker.Mock(return_value=items))
+
+    def create_file(metadata):
+        gfile = mocker.MagicMock()
+        gfile.__getitem__.side_effect = {
+            "id": f"id-{metadata['title']}",
+            "alternateLink": f"https://drive.fake/{metadata['title']}",
+        }.__getitem__
+        return gfile
+
+    return mocker.Mock(
+        ListFile=mocker.Mock(side_effect=list_file),
+        CreateFile=mocker.Mock(side_effect=create_file),
+    )
+
+
+class TestUploadFunctions:
+    """
+    Unit tests for the Google Drive upload workflow and its persistent upload state.
+    """
+
+    @pytest.fixture
+    def audit_setup(self, mocker, tmp_path):
+        """
+        Creates an audit file and its local MP3, with an isolated upload state and folder cache.
+        """
+        mocker.patch.object(paths, "UPLOAD_STATE_FILE", tmp_path / "state.sqlite")
+        mocker.patch.dict(gdrive_uploader._FOLDER_CACHE, clear=True)
+        music_dir = tmp_path / "musicas"
+        mp3_path = music_dir / "Wilson Batista" / "e-mato_62582.mp3"
+        mp3_path.parent.mkdir(parents=True)
+        mp3_path.write_bytes(b"fake_mp3_bytes")
+        audit_path = tmp_path / "auditoria.csv"
+        write_report(MOCK_AUDIT, audit_path)
+        return audit_path, music_dir, mp3_path
+
+    def run_upload(self, mocker, audit_path, music_dir, drive):
+        """
+        Runs the upload as a new process would, with the given drive double, and returns the saved audit.
+        """
+        gdrive_uploader._FOLDER_CACHE.clear()
+        mocker.patch.object(gdrive_uploader, "get_gdrive_instance", return_value=drive)
+        for previous in audit_path.parent.glob("*_upload_audit_*"):
+            previous.unlink()
+        gdrive_uploader.upload_audios_from_csv(str(audit_path), str(music_dir))
+        (output_path,) = audit_path.parent.glob("auditoria_upload_audit_*.parquet")
+        return read_report(output_path)
+
+    @staticmethod
+    def uploaded_titles(drive):
+        """
+        Returns the titles of the files (not folders) created in the drive double.
+        """
+        return [
+            call.args[0]["title"]
+            for call in drive.CreateFile.call_args_list
+            if "mimeType" not in call.args[0]
+        ]
+
+    def test_upload_first_run(self, mocker, audit_setup):
+        """
+        Tests that a new local file is uploaded to its author folder and its Drive URL saved in the audit.
+        """
+        audit_path, music_dir, _ = audit_setup
+        drive = make_drive(mocker)
+
+        df = self.run_upload(mocker, audit_path, music_dir, drive)
+
+        assert self.uploaded_titles(drive) == ["e-mato_62582.mp3"]
+        assert df.iloc[0]["gdrive_url"] == "https://drive.fake/e-mato_62582.mp3"
+
+    def test_second_run_skips_google_drive(self, mocker, audit_setup):
+        """
+        Tests that an unchanged file uploaded in a previous run is not looked up or uploaded again.
+        """
+        audit_path, music_dir, _ = audit_setup
+        self.run_upload(mocker, audit_path, music_dir, make_drive(mocker))
+
+        drive = make_drive(mocker)
+        df = self.run_upload(mocker, audit_path, music_dir, drive)
+
+        assert drive.ListFile.call_count == 0
+        assert drive.CreateFile.call_count == 0
+        assert df.iloc[0]["gdrive_url"] == "https://drive.fake/e-mato_62582.mp3"
+
+    @pytest.mark.parametrize("change", ["size", "mtime"])
+    def test_changed_file_is_uploaded_again(self, mocker, audit_setup, change):
+        """
+        Tests that a file whose size or modification time changed since its upload is uploaded again.
+        """
+        audit_path, music_dir, mp3_path = audit_setup
+        self.run_upload(mocker, audit_path, music_dir, make_drive(mocker))
+
+        if change == "size":
+            mp3_path.write_bytes(b"new_fake_mp3_bytes")
+        else:
+            stat = mp3_path.stat()
+            os.utime(mp3_path, (stat.st_atime, stat.st_mtime + 60))
+        drive = make_drive(mocker)
+        self.run_upload(mocker, audit_path, music_dir, drive)
+
+        assert self.uploaded_titles(drive) == ["e-mato_62582.mp3"]
+
+    def test_existing_drive_file_is_reused(self, mocker, audit_setup):
+        """
+        Tests that a file already in its Drive folder is not uploaded, its URL is reused and recorded for later runs.
+        """
+        audit_path, music_dir, _ = audit_setup
+        drive = make_drive(
+            mocker, existing_files={"e-mato_62582.mp3": "https://drive.fake/existente"}
+        )
+
+        df = self.run_upload(mocker, audit_path, music_dir, drive)
+
+        assert self.uploaded_titles(drive) == []
+        assert df.iloc[0]["gdrive_url"] == "https://drive.fake/existente"
+
+        next_drive = make_drive(mocker)
+        df = self.run_upload(mocker, audit_path, music_dir, next_drive)
+        assert next_drive.ListFile.call_count == 0
+        assert df.iloc[0]["gdrive_url"] == "https://drive.fake/existente"
+
+    def test_repeated_track_is_uploaded_once(self, mocker, audit_setup):
+        """
+        Tests that a file referenced by several audit rows is uploaded once and its URL assigned to every row.
+        """
+        audit_path, music_dir, _ = audit_setup
+        write_report(pd.concat([MOCK_AUDIT, MOCK_AUDIT], ignore_index=True), audit_path)
+        drive = make_drive(mocker)
+
+        df = self.run_upload(mocker, audit_path, music_dir, drive)
+
+        assert self.uploaded_titles(drive) == ["e-mato_62582.mp3"]
+        assert df["gdrive_url"].tolist() == ["https://drive.fake/e-mato_62582.mp3"] * 2
@@ -1,5 +1,27 @@
+import json
+import shutil
+import threading
+from pathlib import Path
+
 import pandas as pd
+import pytest
+from bs4 import BeautifulSoup
+from src.db_scraper import config, paths
 from src.db_scraper.scraper import DiscografiaScraper
+from src.db_scraper.tools import read_report
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(autouse=True)
+def isolated_content_cache(mocker, tmp_path):
+    """
+    Keeps the audio URL cache of each test in its temporary directory instead of the project outputs.
+    """
+    mocker.patch.object(
+        paths, "CONTENT_CACHE_FILE", tmp_path / "outputs" / "content_cache.sqlite"
+    )
+
 
 # Mock data to be used in tests
 MOCK_SONG_DATA = [
@@ -117,3 +139,355 @@ class TestWorkflowFunctions:
         df_audit = pd.read_csv(audit_files[0])
         assert pd.notna(df_audit.iloc[0]["data_download"])
         assert df_audit.iloc[0]["data_download"] != ""
+
+    def test_download_and_audit_dataframe(self, mocker, tmp_path):
+        """
+        Tests that tracks with an audio URL are downloaded into their author folder and audited, reporting progress.
+        """
+        scraper_instance = DiscografiaScraper(output_dir=str(tmp_path))
+        mocker.patch.object(
+            scraper_instance.session,
+            "get",
+            return_value=mocker.Mock(
+                raise_for_status=mocker.Mock(),
+                iter_content=lambda chunk_size: [b"fake_mp3_bytes"],
+            ),
+        )
+        df = pd.DataFrame(
+            MOCK_SONG_DATA
+            + [{"data_id": "43873", "titulo": "Palpite Infeliz", "audio_url": ""}]
+        )
+        progress = []
+
+        df_audit = scraper_instance._download_and_audit_dataframe(
+            df, progress_cb=lambda n_done, n_total: progress.append((n_done, n_total))
+        )
+
+        assert (tmp_path / "Wilson Batista" / "e-mato_62582.mp3").is_file()
+        assert df_audit.iloc[0]["pasta"] == "Wilson Batista"
+        assert df_audit.iloc[0]["nome_arquivo"] == "e-mato_62582.mp3"
+        assert pd.notna(df_audit.iloc[0]["data_download"])
+        assert pd.isna(df_audit.iloc[1]["data_download"])
+        assert progress == [(0, 1), (1, 1)]
+
+    def test_download_audio_uses_unique_temporary_file(self, mocker, tmp_path):
+        """
+        Tests that a download leaves another writer's temporary file alone and no temporary file of its own.
+        """
+        scraper_instance = DiscografiaScraper(output_dir=str(tmp_path))
+        mocker.patch.object(
+            scraper_instance.session,
+            "get",
+            return_value=mocker.Mock(
+                raise_for_status=mocker.Mock(),
+                iter_content=lambda chunk_size: [b"fake_mp3_bytes"],
+            ),
+        )
+        filepath = tmp_path / "e-mato_62582.mp3"
+        other_writer = tmp_path / "e-mato_62582.mp3.part"
+        other_writer.write_bytes(b"partial")
+
+        assert scraper_instance._download_audio("http://fake.url", filepath, "É Mato")
+
+        assert filepath.read_bytes() == b"fake_mp3_bytes"
+        assert other_writer.read_bytes() == b"partial"
+        assert sorted(path.name for path in tmp_path.glob("*.part")) == [
+            other_writer.name
+        ]
+
+    def test_download_and_audit_dataframe_cancelled(self, mocker, tmp_path):
+        """
+        Tests that setting the cancel event skips the downloads not yet started and returns the partial audit.
+        """
+        scraper_instance = DiscografiaScraper(output_dir=str(tmp_path))
+        cancel_event = threading.Event()
+
+        def fake_download(audio_url, filepath, titulo):
+            filepath.write_bytes(b"fake_mp3_bytes")
+            cancel_event.set()
+            return True
+
+        mock_download = mocker.patch.object(
+            scraper_instance, "_download_audio", side_effect=fake_download
+        )
+        df = pd.DataFrame(
+            [
+                {
+                    **MOCK_SONG_DATA[0],
+                    "data_id": str(data_id),
+                    "audio_url": f"u{data_id}",
+                }
+                for data_id in range(5)
+            ]
+        )
+
+        df_audit = scraper_instance._download_and_audit_dataframe(
+            df, max_workers=1, cancel_event=cancel_event
+        )
+
+        assert mock_download.call_count == 1
+        assert df_audit["data_download"].notna().sum() == 1
+        assert df_audit["nome_arquivo"].notna().all()
+
+    def test_download_from_csv_reuses_saved_metadata(self, mocker, tmp_path):
+        """
+        Tests that the metadata returned by save_playlist_to_csv can be downloaded without reading the CSV back,
+        with the requested number of concurrent downloads.
+        """
+        scraper_instance = DiscografiaScraper(output_dir=str(tmp_path))
+        mocker.patch.object(
+            scraper_instance, "_extract_playlist_data", return_value=MOCK_SONG_DATA
+        )
+        mocker.patch.object(
+            scraper_instance.session,
+            "get",
+            return_value=mocker.Mock(
+                raise_for_status=mocker.Mock(),
+                iter_content=lambda chunk_size: [b"fake_mp3_bytes"],
+            ),
+        )
+        mock_read = mocker.patch("src.db_scraper.scraper.read_report")
+        audit = mocker.spy(scraper_instance, "_download_and_audit_dataframe")
+
+        df = scraper_instance.save_playlist_to_csv("fake_id")
+        scraper_instance.download_from_csv(
+            str(tmp_path / "playlist_fake_id_metadata.csv"), df=df, max_workers=2
+        )
+
+        mock_read.assert_not_called()
+        assert audit.call_args.args[2] == 2
+        assert (tmp_path / "Wilson Batista" / "e-mato_62582.mp3").is_file()
+        assert len(list(tmp_path.glob("playlist_fake_id_metadata_*.csv"))) == 1
+
+    def test_download_from_playlist_report_columns(self, mocker, tmp_path):
+        """
+        Tests that the final report keeps the output columns without a reindex copy, or the requested columns.
+        """
+        scraper_instance = DiscografiaScraper(output_dir=str(tmp_path))
+        mocker.patch.object(
+            scraper_instance, "_extract_playlist_data", return_value=MOCK_SONG_DATA
+        )
+        mocker.patch.object(
+            scraper_instance.session,
+            "get",
+            return_value=mocker.Mock(
+                raise_for_status=mocker.Mock(),
+                iter_content=lambda chunk_size: [b"fake_mp3_bytes"],
+            ),
+        )
+        reindex = mocker.spy(pd.DataFrame, "reindex")
+
+        scraper_instance.download_from_playlist("fake_id")
+        (report_path,) = tmp_path.glob("playlist_fake_id_*.csv")
+        report = read_report(report_path)
+        assert list(report.columns) == scraper_instance.config.OUTPUT_COLUMNS
+        assert report.iloc[0]["nome_arquivo"] == "e-mato_62582.mp3"
+        reindex.assert_not_called()
+
+        report_path.unlink()
+        scraper_instance.download_from_playlist(
+            "fake_id", report_columns=["titulo", "pasta"]
+        )
+        (report_path,) = tmp_path.glob("playlist_fake_id_*.csv")
+        assert list(read_report(report_path).columns) == ["titulo", "pasta"]
+        reindex.assert_not_called()
+
+
+class TestExtractionFunctions:
+    """
+    Unit tests for the track parsing and content API helpers of the DiscografiaScraper class.
+    """
+
+    def test_parse_track_data(self, tmp_path):
+        """
+        Tests that every field of a track is parsed, with authors and performers from all their containers.
+        """
+        html = (FIXTURES_DIR / "sample_track_details.html").read_text(encoding="utf-8")
+        scraper_instance = DiscografiaScraper(output_dir=str(tmp_path), use_cache=False)
+
+        track = BeautifulSoup(html, "lxml").find("div", class_="track")
+        song = scraper_instance._parse_track_data(track)
+
+        assert song == {
+            "data_id": "62582",
+            "titulo": "É Mato",
+            "autor": "Wilson Batista / Alvaiade",
+            "interprete": "Odete Amaral / Regional de Benedito Lacerda",
+            "genero": "Samba",
+            "disco": "Odeon 12071",
+            "ano_lancamento_disco": "1941",
+            "data_gravacao": "13 Outubro 1941",
+            "data_lancamento": "Dezembro 1941",
+            "fonte_url": "https://discografiabrasileira.com.br/fonograma/62582/e-mato",
+            "audio_url": "",
+        }
+
+    def test_fill_audio_urls(self, mocker, tmp_path):
+        """
+        Tests that every parsed track receives the audio URL returned by the content API.
+        """
+        html = (FIXTURES_DIR / "sample_tracklist.html").read_text(encoding="utf-8")
+        content = json.loads(
+            (FIXTURES_DIR / "sample_content.json").read_text(encoding="utf-8")
+        )
+        scraper_instance = DiscografiaScraper(output_dir=str(tmp_path))
+        mock_get = mocker.patch.object(
+            scraper_instance.session,
+            "get",
+            return_value=mocker.Mock(
+                raise_for_status=mocker.Mock(), json=lambda: content
+            ),
+        )
+
+        tracks = BeautifulSoup(html, "lxml").find_all("div", class_="track")
+        songs = [scraper_instance._parse_track_data(track) for track in tracks]
+        scraper_instance._fill_audio_urls(songs)
+
+        assert len(songs) == 5
+        assert mock_get.call_count == 5
+        assert all(
+            song["audio_url"]
+            == "https://discografiabrasileira.com.br/api/1.0/assets/75135"
+            for song in songs
+        )
+
+    def test_fetch_audio_url_unexpected_payload(self, mocker, tmp_path):
+        """
+        Tests that content API responses with an unexpected shape are logged and yield an empty audio URL.
+        """
+        scraper_instance = DiscografiaScraper(output_dir=str(tmp_path), use_cache=False)
+        for payload in ({"audio": {"contentUrl": "x"}}, {"audio": [None]}, ["audio"]):
+            mocker.patch.object(
+                scraper_instance.session,
+                "get",
+                return_value=mocker.Mock(
+                    raise_for_status=mocker.Mock(), json=lambda: payload
+                ),
+            )
+            assert scraper_instance._fetch_audio_url("62582", "É Mato") == ""
+
+    def test_fill_audio_urls_uses_cache(self, mocker, tmp_path):
+        """
+        Tests that audio URLs resolved in a previous run are read from the cache instead of the content API.
+        """
+        songs = [{"data_id": "62582", "titulo": "É Mato", "audio_url": ""}]
+        first_run = DiscografiaScraper(output_dir=str(tmp_path))
+        mocker.patch.object(
+            first_run,
+            "_fetch_audio_url",
+            return_value="http://fake.url/audio/62582.mp3",
+        )
+        first_run._fill_audio_urls(songs)
+
+        second_run = DiscografiaScraper(output_dir=str(tmp_path))
+        mock_fetch = mocker.patch.object(second_run, "_fetch_audio_url")
+        cached_songs = [{"data_id": "62582", "titulo": "É Mato", "audio_url": ""}]
+        second_run._fill_audio_urls(cached_songs)
+
+        mock_fetch.assert_not_called()
+        assert cached_songs[0]["audio_url"] == "http://fake.url/audio/62582.mp3"
+
+    def test_fill_audio_urls_survives_deleted_cache(self, mocker, tmp_path):
+        """
+        Tests that deleting the cache file, or the whole outputs directory, between runs only empties the cache.
+        """
+        scraper_instance = DiscografiaScraper(output_dir=str(tmp_path / "downloads"))
+        mock_fetch = mocker.patch.object(
+            scraper_instance,
+            "_fetch_audio_url",
+            return_value="http://fake.url/audio/62582.mp3",
+        )
+
+        for delete in (
+            scraper_instance.audio_url_cache.db_path.unlink,
+            lambda: shutil.rmtree(paths.CONTENT_CACHE_FILE.parent),
+        ):
+            delete()
+            songs = [{"data_id": "62582", "titulo": "É Mato", "audio_url": ""}]
+            scraper_instance._fill_audio_urls(songs)
+            assert songs[0]["audio_url"] == "http://fake.url/audio/62582.mp3"
+
+        assert mock_fetch.call_count == 2
+        # The cache lives outside the output directory, which only holds downloads and reports
+        assert not any(
+            path.suffix == ".sqlite" for path in (tmp_path / "downloads").iterdir()
+        )
+
+    def test_extract_playlist_data(self, mocker, tmp_path):
+        """
+        Tests that a playlist tracklist is parsed into one metadata dictionary per track, with its audio URL.
+        """
+        html = (FIXTURES_DIR / "sample_tracklist.html").read_bytes()
+        content = json.loads(
+            (FIXTURES_DIR / "sample_content.json").read_text(encoding="utf-8")
+        )
+        scraper_instance = DiscografiaScraper(output_dir=str(tmp_path), use_cache=False)
+
+        def fake_get(url, **kwargs):
+            if "/api/1.0/content/" in url:
+                return mocker.Mock(raise_for_status=mocker.Mock(), json=lambda: content)
+            return mocker.Mock(raise_for_status=mocker.Mock(), content=html)
+
+        mock_get = mocker.patch.object(
+            scraper_instance.session, "get", side_effect=fake_get
+        )
+        songs = scraper_instance._extract_playlist_data("fake_id")
+
+        assert [song["data_id"] for song in songs] == [
+            "44160",
+            "49971",
+            "43873",
+            "62582",
+            "61287",
+        ]
+        assert songs[3]["titulo"] == "É Mato"
+        assert songs[3]["autor"] == "Wilson Batista / Alvaiade"
+        assert songs[4]["interprete"] == "Benedito Lacerda / Sílvio Caldas"
+        assert all(song["audio_url"] for song in songs)
+        # The server-rendered tracklist gets the longer listing timeout; content API calls keep the short one
+        timeouts = {
+            "/api/1.0/content/" in call.args[0]: call.kwargs["timeout"]
+            for call in mock_get.call_args_list
+        }
+        assert timeouts == {
+            False: config.HTTP_LISTING_TIMEOUT,
+            True: config.HTTP_TIMEOUT,
+        }
+
+    def test_extract_data_from_url_follows_pagination(self, mocker, tmp_path):
+        """
+        Tests that the tracks of every page are collected, in order, and all receive their audio URLs.
+        """
+        html = (FIXTURES_DIR / "sample_tracklist.html").read_text(encoding="utf-8")
+        first_page = html + (
+            '<span class="pagination-item">'
+            '<a aria-label="Next" href="https://fake.url/page2">Próxima</a></span>'
+        )
+        scraper_instance = DiscografiaScraper(output_dir=str(tmp_path), use_cache=False)
+
+        def fake_get(url, **kwargs):
+            if "/api/1.0/content/" in url:
+                return mocker.Mock(
+                    raise_for_status=mocker.Mock(),
+                    json=lambda: {"audio": [{"contentUrl": [{"@value": url}]}]},
+                )
+            page = html if url.endswith("page2") else first_page
+            return mocker.Mock(raise_for_status=mocker.Mock(), content=page.encode())
+
+        mock_get = mocker.patch.object(
+            scraper_instance.session, "get", side_effect=fake_get
+        )
+        songs = scraper_instance._extract_data_from_url("https://fake.url/page1")
+
+        assert len(songs) == 10
+        assert songs[3]["data_id"] == songs[8]["data_id"] == "62582"
+        assert all(
+            f"/content/{song['data_id']}?" in song["audio_url"] for song in songs
+        )
+        # Tracks repeated on the second page reuse the audio URLs resolved for the first one
+        content_urls = [
+            call.args[0]
+            for call in mock_get.call_args_list
+            if "/api/1.0/content/" in call.args[0]
+        ]
+        assert len(content_urls) == len({song["data_id"] for song in songs})
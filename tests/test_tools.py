@@ -0,0 +1,93 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+from src.db_scraper.tools import merge_reports, read_report, write_report
+
+MOCK_REPORT = pd.DataFrame(
+    {
+        "data_id": ["62582", "43873"],
+        "titulo": ["É Mato", "Palpite Infeliz"],
+        "autor": ["Wilson Batista / Alvaiade", "Noel Rosa"],
+    }
+)
+
+
+class TestReportFunctions:
+    """
+    Unit tests for the report reading and writing helpers.
+    """
+
+    @pytest.mark.parametrize("suffix", [".csv", ".parquet", ".feather"])
+    def test_write_and_read_report(self, tmp_path, suffix):
+        """
+        Tests that a report written in each supported format is read back unchanged.
+        """
+        filepath = tmp_path / f"relatorio{suffix}"
+        write_report(MOCK_REPORT, filepath)
+
+        df = read_report(filepath)
+        pd.testing.assert_frame_equal(
+            df, MOCK_REPORT.astype(pd.ArrowDtype(pa.string()))
+        )
+
+    def test_write_report_xlsx(self, tmp_path):
+        """
+        Tests that XLSX reports are written with the header and one row per track, leaving missing values empty.
+        """
+        filepath = tmp_path / "relatorio.xlsx"
+        report = MOCK_REPORT.assign(genero=["Samba", None])
+        write_report(report, filepath)
+
+        df = pd.read_excel(filepath, dtype=str)
+        assert list(df.columns) == list(report.columns)
+        assert len(df) == 2
+        assert pd.isna(df.iloc[1]["genero"])
+
+    def test_read_report_csv_keeps_ids_as_text(self, tmp_path):
+        """
+        Tests that CSV columns are read as text, keeping leading zeros and reading empty fields as missing values.
+        """
+        filepath = tmp_path / "relatorio.csv"
+        filepath.write_text(
+            "data_id,titulo,gdrive_url\n0123,É Mato,\n", encoding="utf-8-sig"
+        )
+
+        df = read_report(filepath)
+        assert df.iloc[0]["data_id"] == "0123"
+        assert list(df.columns) == ["data_id", "titulo", "gdrive_url"]
+        assert pd.isna(df.iloc[0]["gdrive_url"])
+
+    def test_write_report_keeps_previous_file_on_failure(self, mocker, tmp_path):
+        """
+        Tests that a failed write leaves the previous report untouched and no temporary file behind.
+        """
+        filepath = tmp_path / "relatorio.csv"
+        write_report(MOCK_REPORT, filepath)
+
+        mocker.patch.object(pd.DataFrame, "to_csv", side_effect=OSError("disk full"))
+        with pytest.raises(OSError):
+            write_report(MOCK_REPORT.head(1), filepath)
+
+        assert list(tmp_path.iterdir()) == [filepath]
+        assert len(read_report(filepath)) == 2
+
+    def test_merge_reports_removes_duplicates(self, tmp_path):
+        """
+        Tests that reports in different formats are merged into a single report, keeping the first copy of each track.
+        """
+        first = tmp_path / "relatorio_1.csv"
+        second = tmp_path / "relatorio_2.parquet"
+        write_report(MOCK_REPORT, first)
+        write_report(
+            pd.DataFrame(
+                {"data_id": ["43873", "11111"], "titulo": ["Outro", "Feitio de Oração"]}
+            ),
+            second,
+        )
+
+        merged_path = merge_reports([first, second], tmp_path)
+        assert merged_path.endswith(".parquet")
+
+        merged = read_report(merged_path)
+        assert list(merged["data_id"]) == ["62582", "43873", "11111"]
+        assert merged.iloc[1]["titulo"] == "Palpite Infeliz"